@@ -5,6 +5,7 @@ Settings are loaded from environment variables with sensible defaults.
 """
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,6 +15,7 @@ class Settings(BaseSettings):
 
     Attributes:
         database_url: SQLite database connection URL.
+        sqlite_synchronous: SQLite ``PRAGMA synchronous`` level used with WAL journaling.
         encryption_key: Fernet key for decrypting PATs.
         smtp2go_host: SMTP2GO server hostname.
         smtp2go_port: SMTP2GO server port.
@@ -22,8 +24,11 @@ class Settings(BaseSettings):
         email_from_address: Sender email address.
         application_url: Base URL of the application (for email links).
         schedule_poll_interval: Seconds between schedule DB polls.
+        schedule_poll_max_interval: Upper bound in seconds the poll interval backs
+            off to while schedules are unchanged.
         scheduler_timezone: Timezone for cron job scheduling (IANA timezone name).
         scheduler_executor_pool_size: Max number of concurrent job executions.
+        scheduler_executor_kind: Run jobs in a pool of threads or of processes.
     """
 
     model_config = SettingsConfigDict(
@@ -34,6 +39,7 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./pr_review.db"
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
 
     # Encryption
     encryption_key: str = ""
@@ -52,8 +58,10 @@ class Settings(BaseSettings):
 
     # Scheduler
     schedule_poll_interval: int = 60
+    schedule_poll_max_interval: int = 240
     scheduler_timezone: str = "UTC"
     scheduler_executor_pool_size: int = 10
+    scheduler_executor_kind: Literal["thread", "process"] = "thread"
 
 
 @lru_cache
@@ -5,15 +5,23 @@ This module contains the job that fetches open PRs and sends notification emails
 
 import asyncio
 import logging
-from typing import Any
+from datetime import UTC, datetime
 
 from pr_review_scheduler.config import get_settings
+from pr_review_scheduler.models import PullRequest
 from pr_review_scheduler.services.database import cache_pull_requests, get_schedule_by_id
 from pr_review_scheduler.services.email import format_pr_summary_email, send_notification_email
-from pr_review_scheduler.services.github import get_repository_pull_requests
+from pr_review_scheduler.services.github import (
+    RateLimitError,
+    get_repository_pull_requests,
+    run_coroutine,
+)
 
 logger = logging.getLogger(__name__)
 
+# Seconds a single repository fetch may take before it is abandoned
+_REPO_FETCH_TIMEOUT = 30.0
+
 
 def run_notification_job(schedule_id: str) -> None:
     """Execute the PR notification job for a schedule.
@@ -39,50 +47,69 @@ def run_notification_job(schedule_id: str) -> None:
 
     # 2. Get the decrypted PAT from the schedule
     github_pat = schedule["github_pat"]
-    repositories = schedule.get("repositories", [])
+    # (organization, repository) pairs, unpacked once and reused for every step below
+    repositories = [
+        (repo["organization"], repo["repository"]) for repo in schedule.get("repositories", [])
+    ]
     user_email = schedule.get("user_email")
 
+    if not repositories:
+        logger.info("Schedule %s has no repositories; skipping", schedule_id)
+        return
+
     # 3. Fetch PRs from GitHub for each repository concurrently
-    all_prs: list[dict[str, Any]] = []
+    all_prs: list[PullRequest] = []
     pr_counts: dict[str, int] = {}
+    # Repositories whose open PRs were all fetched; only their cached PRs are replaced
+    fetched_repositories: list[tuple[str, str]] = []
+
+    async def _fetch_all_prs() -> list[list[PullRequest] | BaseException]:
+        tasks = [
+            asyncio.wait_for(
+                get_repository_pull_requests(github_pat, org, repo_name),
+                timeout=_REPO_FETCH_TIMEOUT,
+            )
+            for org, repo_name in repositories
+        ]
+        # Collect failures per repository so one bad repo doesn't discard the rest
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Fetch all repositories concurrently on the shared event loop, reusing
+    # pooled connections to GitHub from previous runs
+    prs_results = run_coroutine(_fetch_all_prs())
+
+    for (org, repo_name), prs in zip(repositories, prs_results):
+        repo_full_name = f"{org}/{repo_name}"
+
+        if isinstance(prs, RateLimitError):
+            logger.warning(
+                "GitHub rate limit exhausted; skipping %s until %s",
+                repo_full_name,
+                datetime.fromtimestamp(prs.reset_at, UTC).isoformat(),
+            )
+            continue
 
-    if repositories:
-        # Log the repositories we are about to fetch PRs for
-        for repo in repositories:
-            logger.info("Fetching PRs for %s/%s", repo["organization"], repo["repository"])
-
-        async def _fetch_all_prs() -> list[list[dict[str, Any]]]:
-            tasks = [
-                get_repository_pull_requests(
-                    github_pat, repo["organization"], repo["repository"]
-                )
-                for repo in repositories
-            ]
-            return await asyncio.gather(*tasks)
-
-        # Fetch all repositories concurrently with a single event loop
-        prs_results = asyncio.run(_fetch_all_prs())
-
-        for repo, prs in zip(repositories, prs_results):
-            org = repo["organization"]
-            repo_name = repo["repository"]
-            repo_full_name = f"{org}/{repo_name}"
-
-            if prs:
-                all_prs.extend(prs)
-                pr_counts[repo_full_name] = len(prs)
-                logger.info("Found %d PRs in %s", len(prs), repo_full_name)
-            else:
-                logger.info("No open PRs found in %s", repo_full_name)
-
-    # 4. If PRs found, cache them and send email
+        if isinstance(prs, BaseException):
+            logger.error("Failed to fetch PRs for %s: %r", repo_full_name, prs)
+            continue
+
+        fetched_repositories.append((org, repo_name))
+        if prs:
+            all_prs.extend(prs)
+            pr_counts[repo_full_name] = len(prs)
+            logger.info("Found %d PRs in %s", len(prs), repo_full_name)
+        else:
+            logger.info("No open PRs found in %s", repo_full_name)
+
+    # 4. Cache the PRs of fetched repositories, dropping ones that have closed
+    if fetched_repositories:
+        cache_pull_requests(schedule_id, all_prs, fetched_repositories)
+
+    # 5. If PRs found, send email
     if all_prs:
         logger.info("Total PRs found: %d across %d repositories", len(all_prs), len(pr_counts))
 
-        # Cache the PRs
-        cache_pull_requests(schedule_id, all_prs)
-
-        # 5. Send email if user has email configured
+        # Send email if user has email configured
         if not user_email:
             logger.warning(
                 "No email configured for schedule %s (user_id: %s). "
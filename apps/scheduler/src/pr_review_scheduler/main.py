@@ -8,8 +8,6 @@ Usage:
 
 import logging
 import signal
-import sys
-import time
 from threading import Event, Thread
 from types import FrameType
 
@@ -17,11 +15,11 @@ from pr_review_scheduler import __version__
 from pr_review_scheduler.config import get_settings
 from pr_review_scheduler.scheduler import (
     create_scheduler,
-    get_all_jobs,
+    get_job_count,
     shutdown_scheduler,
     start_scheduler,
 )
-from pr_review_scheduler.sync import sync_schedules
+from pr_review_scheduler.sync import reset_sync_state, sync_schedules
 
 # Configure logging
 logging.basicConfig(
@@ -30,9 +28,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Global scheduler instance for signal handlers
-_scheduler = None
-
 # Event for signaling threads to stop
 _stop_event = Event()
 
@@ -40,6 +35,8 @@ _stop_event = Event()
 def signal_handler(signum: int, frame: FrameType | None) -> None:
     """Handle termination signals for graceful shutdown.
 
+    Only wakes the main thread, which owns shutting the scheduler down.
+
     Args:
         signum: Signal number received.
         frame: Current stack frame.
@@ -47,32 +44,43 @@ def signal_handler(signum: int, frame: FrameType | None) -> None:
     sig_name = signal.Signals(signum).name
     logger.info("Received signal %s, shutting down...", sig_name)
     _stop_event.set()
-    if _scheduler:
-        shutdown_scheduler(_scheduler, wait=True)
-    sys.exit(0)
 
 
-def polling_loop(scheduler, poll_interval: int) -> None:
+def polling_loop(scheduler, poll_interval: int, max_poll_interval: int | None = None) -> None:
     """Background thread that polls for schedule changes.
 
+    The wait between polls doubles each time a sync finds nothing to change,
+    up to ``max_poll_interval``, and drops back to ``poll_interval`` as soon
+    as a sync changes a job or fails.
+
     Args:
         scheduler: The APScheduler BackgroundScheduler instance.
         poll_interval: Seconds between polls.
+        max_poll_interval: Upper bound for the backed-off interval. Defaults to
+            ``poll_interval`` (no backoff).
     """
-    logger.info("Starting schedule polling loop (interval: %ds)", poll_interval)
-    while not _stop_event.is_set():
+    max_poll_interval = max(max_poll_interval or poll_interval, poll_interval)
+    logger.info(
+        "Starting schedule polling loop (interval: %ds, max: %ds)",
+        poll_interval,
+        max_poll_interval,
+    )
+    interval = poll_interval
+    while not _stop_event.wait(timeout=interval):
         try:
-            sync_schedules(scheduler)
+            changes = sync_schedules(scheduler)
         except Exception as e:
             logger.error("Error syncing schedules: %s", e)
-        _stop_event.wait(timeout=poll_interval)
+            changes = None
+        if changes == 0:
+            interval = min(interval * 2, max_poll_interval)
+        else:
+            interval = poll_interval
     logger.info("Polling loop stopped")
 
 
 def main() -> None:
     """Main entry point for the scheduler service."""
-    global _scheduler
-
     settings = get_settings()
 
     logger.info("Starting PR-Review Scheduler v%s", __version__)
@@ -80,47 +88,51 @@ def main() -> None:
     logger.info("  Database URL: %s", settings.database_url)
     logger.info("  Timezone: %s", settings.scheduler_timezone)
     logger.info("  Poll interval: %d seconds", settings.schedule_poll_interval)
+    logger.info("  Max poll interval: %d seconds", settings.schedule_poll_max_interval)
+    logger.info("  Executor: %s", settings.scheduler_executor_kind)
     logger.info("  Executor pool size: %d", settings.scheduler_executor_pool_size)
 
     # Create and start scheduler
-    _scheduler = create_scheduler()
+    scheduler = create_scheduler()
+    reset_sync_state()
 
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
 
+    poll_thread = None
     try:
-        start_scheduler(_scheduler)
+        start_scheduler(scheduler)
 
         # Initial sync
         logger.info("Performing initial schedule sync...")
-        sync_schedules(_scheduler)
+        sync_schedules(scheduler)
 
         # Start polling thread
         poll_thread = Thread(
             target=polling_loop,
-            args=(_scheduler, settings.schedule_poll_interval),
+            args=(
+                scheduler,
+                settings.schedule_poll_interval,
+                settings.schedule_poll_max_interval,
+            ),
             daemon=True,
         )
         poll_thread.start()
 
         logger.info("Scheduler is running. Press Ctrl+C to exit.")
 
-        # Keep the main thread alive and log status periodically
+        # Park the main thread until stopped, logging status periodically
         status_interval = 300  # Log status every 5 minutes
-        elapsed = 0
-        while not _stop_event.is_set():
-            time.sleep(1)
-            elapsed += 1
-            if elapsed >= status_interval:
-                job_count = len(get_all_jobs(_scheduler))
-                logger.info("Scheduler status: %d active jobs", job_count)
-                elapsed = 0
-
-    except (KeyboardInterrupt, SystemExit):
+        while not _stop_event.wait(timeout=status_interval):
+            logger.info("Scheduler status: %d active jobs", get_job_count())
+
+    finally:
         logger.info("Shutting down scheduler...")
         _stop_event.set()
-        shutdown_scheduler(_scheduler, wait=True)
+        if poll_thread is not None:
+            poll_thread.join()
+        shutdown_scheduler(scheduler, wait=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""Data types shared across the scheduler.
+
+These are plain value objects passed between the GitHub service, the
+notification job and the database service; ORM models live in
+``services.database``.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class PullRequest:
+    """An open pull request fetched from GitHub.
+
+    Instances are immutable, so one fetch result can be handed to every
+    schedule watching the same repository.
+
+    Attributes:
+        number: Pull request number.
+        title: Pull request title.
+        author: GitHub username of the author.
+        author_avatar_url: URL to the author's avatar.
+        labels: Label names.
+        checks_status: 'pass', 'fail' or 'pending'.
+        html_url: URL to the pull request on GitHub.
+        created_at: When the pull request was opened.
+        organization: GitHub organization name.
+        repository: Repository name.
+    """
+
+    number: int
+    title: str
+    author: str
+    author_avatar_url: str | None
+    labels: tuple[str, ...]
+    checks_status: str | None
+    html_url: str
+    created_at: datetime
+    organization: str
+    repository: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PullRequest":
+        """Build a pull request from a dict keyed by field name.
+
+        Args:
+            data: Pull request fields. ``created_at`` may be an ISO 8601
+                string and ``labels`` may be a list or None.
+
+        Returns:
+            The pull request.
+        """
+        created_at = data["created_at"]
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+
+        return cls(
+            number=data["number"],
+            title=data["title"],
+            author=data["author"],
+            author_avatar_url=data.get("author_avatar_url"),
+            labels=tuple(data.get("labels") or ()),
+            checks_status=data.get("checks_status"),
+            html_url=data["html_url"],
+            created_at=created_at,
+            organization=data["organization"],
+            repository=data["repository"],
+        )
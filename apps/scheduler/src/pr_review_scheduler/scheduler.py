@@ -5,22 +5,30 @@ scheduled notification jobs.
 """
 
 import logging
+import multiprocessing
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
-from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.executors.pool import ProcessPoolExecutor, ThreadPoolExecutor
+from apscheduler.jobstores.base import JobLookupError
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from pr_review_scheduler.config import get_settings
 from pr_review_scheduler.jobs.pr_notification import run_notification_job
+from pr_review_scheduler.services.github import close_github_client
 
 if TYPE_CHECKING:
     from apscheduler.job import Job
 
 logger = logging.getLogger(__name__)
 
+# IDs of jobs added through this module, so status logging needn't walk the job store
+_job_ids: set[str] = set()
+
 
 class JobNotFoundError(Exception):
     """Raised when a job is not found in the scheduler."""
@@ -30,11 +38,33 @@ class JobNotFoundError(Exception):
         super().__init__(f"Job not found: {job_id}")
 
 
+@lru_cache(maxsize=1024)
+def _cron_trigger(cron_expression: str, timezone: str) -> CronTrigger:
+    """Parse a cron expression into a trigger, cached per expression and timezone.
+
+    Cron triggers hold no per-job state, so jobs with the same expression can
+    share one instance.
+
+    Args:
+        cron_expression: Standard 5-field cron expression.
+        timezone: IANA timezone name the expression is evaluated in.
+
+    Returns:
+        The CronTrigger for the expression.
+
+    Raises:
+        ValueError: If the cron expression is invalid.
+    """
+    return CronTrigger.from_crontab(cron_expression, timezone=ZoneInfo(timezone))
+
+
 def create_scheduler() -> BackgroundScheduler:
     """Create and configure the APScheduler instance.
 
     Configures the scheduler with:
-    - ThreadPoolExecutor for concurrent job execution
+    - ThreadPoolExecutor (or ProcessPoolExecutor when ``scheduler_executor_kind``
+      is ``"process"``) for concurrent job execution
+    - In-memory job store (jobs are rebuilt from the database by sync_schedules)
     - Timezone from settings (default: UTC)
     - Job defaults for coalescing, max instances, and misfire handling
 
@@ -43,8 +73,25 @@ def create_scheduler() -> BackgroundScheduler:
     """
     settings = get_settings()
     timezone = ZoneInfo(settings.scheduler_timezone)
-
-    executors = {"default": ThreadPoolExecutor(max_workers=settings.scheduler_executor_pool_size)}
+    _job_ids.clear()
+
+    # Processes sidestep the GIL when formatting large summaries; each worker
+    # process then runs its own GitHub event loop and client. Workers are spawned
+    # rather than forked: by the time a job runs this process has the scheduler,
+    # event loop and poll threads plus pooled DB connections, none of which are
+    # safe to copy into a child.
+    if settings.scheduler_executor_kind == "process":
+        executor = ProcessPoolExecutor(
+            max_workers=settings.scheduler_executor_pool_size,
+            pool_kwargs={"mp_context": multiprocessing.get_context("spawn")},
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=settings.scheduler_executor_pool_size)
+    executors = {"default": executor}
+
+    # Schedules are persisted by web-be; keeping jobs in memory avoids a second
+    # store that would need a write per add/replace/remove
+    jobstores = {"default": MemoryJobStore()}
 
     job_defaults = {
         # Combine multiple pending runs into one when a job couldn't be executed on time
@@ -56,14 +103,16 @@ def create_scheduler() -> BackgroundScheduler:
     }
 
     scheduler = BackgroundScheduler(
+        jobstores=jobstores,
         executors=executors,
         job_defaults=job_defaults,
         timezone=timezone,
     )
 
     logger.info(
-        "Created scheduler with timezone=%s, executor_pool_size=%d",
+        "Created scheduler with timezone=%s, executor=%s, executor_pool_size=%d",
         settings.scheduler_timezone,
+        settings.scheduler_executor_kind,
         settings.scheduler_executor_pool_size,
     )
 
@@ -78,12 +127,15 @@ def start_scheduler(scheduler: BackgroundScheduler) -> None:
     """
     if not scheduler.running:
         scheduler.start()
+        _job_ids.update(job.id for job in scheduler.get_jobs())
         logger.info("Scheduler started")
 
 
 def shutdown_scheduler(scheduler: BackgroundScheduler, wait: bool = True) -> None:
     """Gracefully shutdown the scheduler.
 
+    When waiting for running jobs, the shared GitHub client is closed as well.
+
     Args:
         scheduler: The scheduler instance to shutdown.
         wait: Whether to wait for running jobs to complete.
@@ -91,6 +143,9 @@ def shutdown_scheduler(scheduler: BackgroundScheduler, wait: bool = True) -> Non
     if scheduler.running:
         scheduler.shutdown(wait=wait)
         logger.info("Scheduler shut down")
+        if wait:
+            # No job can still be using the client once the executor has drained
+            close_github_client()
 
 
 def add_cron_job(
@@ -119,10 +174,7 @@ def add_cron_job(
     Raises:
         ValueError: If the cron expression is invalid.
     """
-    settings = get_settings()
-    timezone = ZoneInfo(settings.scheduler_timezone)
-
-    trigger = CronTrigger.from_crontab(cron_expression, timezone=timezone)
+    trigger = _cron_trigger(cron_expression, get_settings().scheduler_timezone)
 
     job = scheduler.add_job(
         func,
@@ -132,6 +184,7 @@ def add_cron_job(
         kwargs=kwargs or {},
         replace_existing=replace_existing,
     )
+    _job_ids.add(job_id)
 
     logger.info("Added cron job: %s with expression '%s'", job_id, cron_expression)
     return job
@@ -150,6 +203,26 @@ def get_job(scheduler: BackgroundScheduler, job_id: str) -> "Job | None":
     return scheduler.get_job(job_id)
 
 
+def get_job_count() -> int:
+    """Get the number of jobs added through this module and not yet removed.
+
+    Returns:
+        Number of scheduled jobs.
+    """
+    return len(_job_ids)
+
+
+def get_job_ids() -> frozenset[str]:
+    """Get the IDs of jobs added through this module and not yet removed.
+
+    Unlike ``get_all_jobs``, this doesn't walk the scheduler's job store.
+
+    Returns:
+        Snapshot of the scheduled job IDs.
+    """
+    return frozenset(_job_ids)
+
+
 def get_all_jobs(scheduler: BackgroundScheduler) -> list["Job"]:
     """Get all scheduled jobs.
 
@@ -172,12 +245,14 @@ def remove_job(scheduler: BackgroundScheduler, job_id: str) -> bool:
     Returns:
         True if the job was removed, False if it didn't exist.
     """
-    job = scheduler.get_job(job_id)
-    if job:
+    try:
         scheduler.remove_job(job_id)
-        logger.info("Removed job: %s", job_id)
-        return True
-    return False
+    except JobLookupError:
+        return False
+
+    _job_ids.discard(job_id)
+    logger.info("Removed job: %s", job_id)
+    return True
 
 
 def update_job(
@@ -198,18 +273,17 @@ def update_job(
     Raises:
         JobNotFoundError: If the job with the given ID does not exist.
     """
-    job = scheduler.get_job(job_id)
-    if not job:
-        raise JobNotFoundError(job_id)
-
     if not cron_expression:
+        if scheduler.get_job(job_id) is None:
+            raise JobNotFoundError(job_id)
         logger.info("No update parameters provided for job %s; no changes made", job_id)
         return False
 
-    settings = get_settings()
-    timezone = ZoneInfo(settings.scheduler_timezone)
-    trigger = CronTrigger.from_crontab(cron_expression, timezone=timezone)
-    job.reschedule(trigger)
+    trigger = _cron_trigger(cron_expression, get_settings().scheduler_timezone)
+    try:
+        scheduler.reschedule_job(job_id, trigger=trigger)
+    except JobLookupError:
+        raise JobNotFoundError(job_id) from None
     logger.info("Updated job %s with new expression '%s'", job_id, cron_expression)
 
     return True
@@ -232,14 +306,8 @@ def add_notification_job(
     Returns:
         The created job instance.
     """
-    # Remove existing job if present (allows replacement)
-    remove_job(scheduler, schedule_id)
-
-    settings = get_settings()
-    timezone = ZoneInfo(settings.scheduler_timezone)
-
     # Parse cron expression into CronTrigger
-    trigger = CronTrigger.from_crontab(cron_expression, timezone=timezone)
+    trigger = _cron_trigger(cron_expression, get_settings().scheduler_timezone)
 
     # Add the job
     job = scheduler.add_job(
@@ -248,7 +316,9 @@ def add_notification_job(
         id=schedule_id,
         args=[schedule_id],
         name=f"PR notification for schedule {schedule_id}",
+        replace_existing=True,
     )
+    _job_ids.add(schedule_id)
 
     logger.info("Added notification job: %s with cron: %s", schedule_id, cron_expression)
     return job
@@ -6,16 +6,46 @@ cross-package dependencies.
 """
 
 import logging
+import os
+import time
+from collections.abc import Iterable
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
-from uuid import uuid4
+from uuid import UUID
 
 from pr_review_shared.encryption import DecryptionError, decrypt_token
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, create_engine
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    and_,
+    bindparam,
+    create_engine,
+    delete,
+    event,
+    func,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
+from sqlalchemy.orm import (
+    Session,
+    declarative_base,
+    joinedload,
+    relationship,
+    selectinload,
+    sessionmaker,
+)
 
 from pr_review_scheduler.config import get_settings
+from pr_review_scheduler.models import PullRequest
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +55,20 @@ Base = declarative_base()
 # Module-level engine cache
 _engine: Engine | None = None
 
+# Session factory, built once and bound to the engine when a session is opened.
+# Sessions are closed straight after commit, so expiring loaded objects would
+# only cost re-SELECTs if they are read afterwards.
+_session_factory = sessionmaker(autoflush=False, expire_on_commit=False)
+
+# PRAGMAs applied to every new SQLite connection (synchronous comes from settings).
+# WAL lets readers proceed during writes and avoids a journal fsync per commit.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+)
+
 
 def utcnow() -> datetime:
     """Get current UTC time (timezone-aware)."""
@@ -32,8 +76,18 @@ def utcnow() -> datetime:
 
 
 def generate_uuid() -> str:
-    """Generate a new UUID string."""
-    return str(uuid4())
+    """Generate a new time-ordered (version 7) UUID string.
+
+    The leading 48 bits are the Unix time in milliseconds, so keys created
+    together sort together and bulk inserts append to the primary key index
+    rather than landing at random positions in it.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Version 7 and RFC 4122 variant bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return str(UUID(int=value))
 
 
 # -----------------------------------------------------------------------------
@@ -75,16 +129,15 @@ class NotificationSchedule(Base):
     name = Column(String, nullable=False)
     cron_expression = Column(String, nullable=False)
     github_pat = Column(String, nullable=False)  # Encrypted
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, default=utcnow)
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
 
     repositories = relationship(
         "ScheduleRepository",
         back_populates="schedule",
-        lazy="joined",
     )
-    user = relationship("User", lazy="joined")
+    user = relationship("User")
     cached_pull_requests = relationship(
         "CachedPullRequest",
         back_populates="schedule",
@@ -139,7 +192,7 @@ class CachedPullRequest(Base):
     title = Column(String, nullable=False)
     author = Column(String, nullable=False)
     author_avatar_url = Column(String, nullable=True)
-    labels = Column(String, nullable=True)  # JSON array
+    labels = Column(JSON(none_as_null=True), nullable=True)  # List of label names
     checks_status = Column(String, nullable=True)  # 'pass', 'fail', 'pending'
     html_url = Column(String, nullable=False)
     created_at = Column(DateTime, nullable=False)
@@ -147,6 +200,16 @@ class CachedPullRequest(Base):
 
     schedule = relationship("NotificationSchedule", back_populates="cached_pull_requests")
 
+    __table_args__ = (
+        UniqueConstraint(
+            "schedule_id",
+            "organization",
+            "repository",
+            "pr_number",
+            name="uq_schedule_org_repo_pr",
+        ),
+    )
+
     def __repr__(self) -> str:
         """Return string representation of the cached pull request."""
         return (
@@ -155,29 +218,104 @@ class CachedPullRequest(Base):
         )
 
 
+# Statements used by cache_pull_requests, built once at import. Core statements skip
+# ORM bulk-insert bookkeeping; column defaults (id) are still applied on insert.
+_cached_prs_table = CachedPullRequest.__table__
+_CACHED_PR_KEY_COLUMNS = ("schedule_id", "organization", "repository", "pr_number")
+_CACHED_PR_UPDATE_COLUMNS = (
+    "title",
+    "author",
+    "author_avatar_url",
+    "labels",
+    "checks_status",
+    "html_url",
+    "created_at",
+    "cached_at",
+)
+
+
+def _build_cached_pr_upsert(dialect_insert: Any) -> Any:
+    """Build an INSERT ... ON CONFLICT DO UPDATE for cached PRs.
+
+    Args:
+        dialect_insert: The dialect's ``insert`` construct (SQLite or PostgreSQL).
+
+    Returns:
+        Upsert statement keyed on the cached PR unique constraint.
+    """
+    stmt = dialect_insert(_cached_prs_table)
+    return stmt.on_conflict_do_update(
+        index_elements=list(_CACHED_PR_KEY_COLUMNS),
+        set_={column: stmt.excluded[column] for column in _CACHED_PR_UPDATE_COLUMNS},
+    )
+
+
+# Upsert per dialect name; both dialects support ON CONFLICT on the unique constraint
+_UPSERT_CACHED_PRS = {
+    "sqlite": _build_cached_pr_upsert(sqlite.insert),
+    "postgresql": _build_cached_pr_upsert(postgresql.insert),
+}
+# Rows of a fetched repository not touched by this run's upsert belong to PRs that have
+# since closed. Repositories that weren't fetched keep their rows.
+_DELETE_STALE_CACHED_PRS = delete(_cached_prs_table).where(
+    _cached_prs_table.c.schedule_id == bindparam("schedule_id"),
+    tuple_(_cached_prs_table.c.organization, _cached_prs_table.c.repository).in_(
+        bindparam("repositories", expanding=True)
+    ),
+    _cached_prs_table.c.cached_at.is_distinct_from(bindparam("cached_at")),
+)
+
 # -----------------------------------------------------------------------------
 # Engine and Session Management
 # -----------------------------------------------------------------------------
 
 
+def _configure_sqlite_connection(dbapi_connection: Any, synchronous: str) -> None:
+    """Apply performance PRAGMAs to a new SQLite connection.
+
+    Args:
+        dbapi_connection: Raw DBAPI connection being opened.
+        synchronous: Value for ``PRAGMA synchronous``.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.execute(f"PRAGMA synchronous={synchronous}")
+    finally:
+        cursor.close()
+
+
 def _get_engine() -> Engine:
     """Get or create the database engine.
 
+    SQLite connections are switched to WAL journaling with tuned PRAGMAs
+    as they are opened.
+
     Returns:
         SQLAlchemy Engine instance configured for the database.
     """
     global _engine
     if _engine is None:
         settings = get_settings()
-        connect_args = (
-            {"check_same_thread": False}
-            if settings.database_url.startswith("sqlite")
-            else {}
-        )
+        is_sqlite = settings.database_url.startswith("sqlite")
+        connect_args = {"check_same_thread": False} if is_sqlite else {}
         _engine = create_engine(
             settings.database_url,
             connect_args=connect_args,
+            # Room for every statement variant the scheduler issues, including
+            # eager-load and relationship lazy-load queries
+            query_cache_size=1200,
         )
+        if is_sqlite:
+            synchronous = settings.sqlite_synchronous
+            event.listen(
+                _engine,
+                "connect",
+                lambda dbapi_connection, _record: _configure_sqlite_connection(
+                    dbapi_connection, synchronous
+                ),
+            )
     return _engine
 
 
@@ -187,9 +325,38 @@ def _get_session() -> Session:
     Returns:
         A new SQLAlchemy Session instance.
     """
-    engine = _get_engine()
-    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return session_factory()
+    return _session_factory(bind=_get_engine())
+
+
+@lru_cache(maxsize=1024)
+def _decrypt_pat(ciphertext: str, encryption_key: str) -> str:
+    """Decrypt a schedule's GitHub PAT, memoized in process memory.
+
+    Fernet ciphertexts carry a random IV, so a PAT that is re-saved gets a new
+    ciphertext and therefore a new cache entry. Failed decryptions raise and
+    are not cached.
+
+    Args:
+        ciphertext: The encrypted PAT as stored on the schedule.
+        encryption_key: Fernet key used to decrypt it.
+
+    Returns:
+        The decrypted PAT.
+
+    Raises:
+        DecryptionError: If the PAT cannot be decrypted with the key.
+    """
+    return decrypt_token(ciphertext, encryption_key)
+
+
+def invalidate_pat_cache() -> None:
+    """Drop all memoized decrypted PATs.
+
+    Entries are keyed by ciphertext, so updated PATs never hit stale entries;
+    call this to purge plaintext tokens from memory, e.g. after rotating the
+    encryption key.
+    """
+    _decrypt_pat.cache_clear()
 
 
 def _schedule_to_dict(schedule: NotificationSchedule, decrypted_pat: str) -> dict[str, Any]:
@@ -224,51 +391,13 @@ def _schedule_to_dict(schedule: NotificationSchedule, decrypted_pat: str) -> dic
 # Query Functions
 # -----------------------------------------------------------------------------
 
-
-def get_active_schedules() -> list[dict[str, Any]]:
-    """Get all active notification schedules from the database.
-
-    Queries for active schedules, joins with repositories, and decrypts PATs.
-    Schedules with decryption errors are logged and skipped.
-
-    Returns:
-        List of active schedule dictionaries with decrypted PAT and repositories.
-    """
-    settings = get_settings()
-    logger.debug("Fetching active schedules from %s", settings.database_url)
-
-    session = _get_session()
-    try:
-        schedules = (
-            session.query(NotificationSchedule)
-            .filter(NotificationSchedule.is_active.is_(True))
-            .all()
-        )
-
-        result = []
-        for schedule in schedules:
-            try:
-                decrypted_pat = decrypt_token(schedule.github_pat, settings.encryption_key)
-                result.append(_schedule_to_dict(schedule, decrypted_pat))
-            except DecryptionError as e:
-                logger.error(
-                    "Failed to decrypt PAT for schedule %s: %s. Skipping schedule.",
-                    schedule.id,
-                    e,
-                )
-                continue
-            except Exception as e:
-                logger.error(
-                    "Unexpected error processing schedule %s: %s. Skipping schedule.",
-                    schedule.id,
-                    e,
-                )
-                continue
-
-        logger.debug("Found %d active schedules", len(result))
-        return result
-    finally:
-        session.close()
+# Eager loads for everything _schedule_to_dict reads. Repositories come from one
+# extra SELECT ... IN query rather than a JOIN that repeats each schedule row
+# per repository; the single user row is joined in.
+_SCHEDULE_LOAD_OPTIONS = (
+    selectinload(NotificationSchedule.repositories),
+    joinedload(NotificationSchedule.user),
+)
 
 
 def get_schedule_by_id(schedule_id: str) -> dict[str, Any] | None:
@@ -285,17 +414,13 @@ def get_schedule_by_id(schedule_id: str) -> dict[str, Any] | None:
     settings = get_settings()
     session = _get_session()
     try:
-        schedule = (
-            session.query(NotificationSchedule)
-            .filter(NotificationSchedule.id == schedule_id)
-            .first()
-        )
+        schedule = session.get(NotificationSchedule, schedule_id, options=_SCHEDULE_LOAD_OPTIONS)
 
         if schedule is None:
             return None
 
         try:
-            decrypted_pat = decrypt_token(schedule.github_pat, settings.encryption_key)
+            decrypted_pat = _decrypt_pat(schedule.github_pat, settings.encryption_key)
             return _schedule_to_dict(schedule, decrypted_pat)
         except DecryptionError as e:
             logger.error(
@@ -321,7 +446,7 @@ def get_user_email(user_id: str) -> str | None:
 
     session = _get_session()
     try:
-        user = session.query(User).filter(User.id == user_id).first()
+        user = session.get(User, user_id)
 
         if user is None:
             return None
@@ -331,60 +456,126 @@ def get_user_email(user_id: str) -> str | None:
         session.close()
 
 
-def get_all_schedule_ids() -> list[str]:
-    """Get all schedule IDs (both active and inactive).
+def get_schedules_with_status() -> list[dict[str, Any]]:
+    """Get every schedule's ID, cron expression and active flag in one query.
+
+    This is all sync_schedules needs, so PATs are neither loaded nor
+    decrypted. A schedule without repositories has nothing to fetch and is
+    reported as inactive.
 
     Returns:
-        List of all schedule IDs.
+        List of dictionaries with ``id``, ``cron_expression`` and ``is_active``.
     """
-    logger.debug("Fetching all schedule IDs")
+    logger.debug("Fetching schedule statuses")
 
     session = _get_session()
     try:
-        schedules = session.query(NotificationSchedule.id).all()
-        return [schedule.id for schedule in schedules]
+        rows = session.execute(
+            select(
+                NotificationSchedule.id,
+                NotificationSchedule.cron_expression,
+                and_(
+                    NotificationSchedule.is_active.is_(True),
+                    NotificationSchedule.repositories.any(),
+                ).label("is_active"),
+            )
+        )
+        return [
+            {
+                "id": row.id,
+                "cron_expression": row.cron_expression,
+                "is_active": bool(row.is_active),
+            }
+            for row in rows
+        ]
+    finally:
+        session.close()
+
+
+def get_schedules_version() -> tuple[int, datetime | None, int]:
+    """Get a cheap fingerprint of the schedule tables.
+
+    Creating or deleting a schedule changes the count, editing one (cron,
+    active flag) bumps its ``updated_at``, and adding or removing repositories
+    changes the repository count, so an unchanged fingerprint means there is
+    nothing for sync_schedules to reconcile.
+
+    Returns:
+        Tuple of (schedule count, latest schedule ``updated_at``,
+        schedule repository count).
+    """
+    session = _get_session()
+    try:
+        repository_count = select(func.count(ScheduleRepository.id)).scalar_subquery()
+        row = session.execute(
+            select(
+                func.count(NotificationSchedule.id),
+                func.max(NotificationSchedule.updated_at),
+                repository_count,
+            )
+        ).one()
+        return row[0], row[1], row[2]
     finally:
         session.close()
 
 
 def cache_pull_requests(
     schedule_id: str,
-    pull_requests: list[dict[str, Any]],
+    pull_requests: list[PullRequest],
+    repositories: Iterable[tuple[str, str]],
 ) -> None:
     """Cache fetched pull requests in the database.
 
-    Replaces any existing cached PRs for the schedule.
+    Replaces the cached PRs of each fetched repository for the schedule. PRs
+    that are still open are updated in place and closed ones are deleted, so
+    unchanged PRs don't churn the table and its indexes. Cached PRs of other
+    repositories, e.g. ones whose fetch failed, are left alone.
 
     Args:
         schedule_id: The schedule ID.
-        pull_requests: List of PR data dicts with keys:
-            number, title, author, author_avatar_url, labels,
-            checks_status, html_url, created_at, organization, repository
+        pull_requests: Pull requests to cache.
+        repositories: (organization, repository) pairs that were fetched
+            successfully; ``pull_requests`` holds all of their open PRs.
     """
     logger.debug("Caching %d PRs for schedule: %s", len(pull_requests), schedule_id)
 
+    cached_at = utcnow()
+    # Keyed like the unique constraint so a PR listed twice (e.g. when it moves
+    # between pages mid-fetch) is written once
+    rows = {
+        (pr.organization, pr.repository, pr.number): {
+            "schedule_id": schedule_id,
+            "organization": pr.organization,
+            "repository": pr.repository,
+            "pr_number": pr.number,
+            "title": pr.title,
+            "author": pr.author,
+            "author_avatar_url": pr.author_avatar_url,
+            "labels": list(pr.labels),
+            "checks_status": pr.checks_status,
+            "html_url": pr.html_url,
+            "created_at": pr.created_at,
+            "cached_at": cached_at,
+        }
+        for pr in pull_requests
+    }
+
     session = _get_session()
     try:
-        # Delete existing cached PRs for this schedule
-        session.query(CachedPullRequest).filter_by(schedule_id=schedule_id).delete()
-
-        # Insert new PRs
-        for pr in pull_requests:
-            cached_pr = CachedPullRequest(
-                id=str(uuid4()),
-                schedule_id=schedule_id,
-                organization=pr["organization"],
-                repository=pr["repository"],
-                pr_number=pr["number"],
-                title=pr["title"],
-                author=pr["author"],
-                author_avatar_url=pr.get("author_avatar_url"),
-                labels=pr.get("labels"),
-                checks_status=pr.get("checks_status"),
-                html_url=pr["html_url"],
-                created_at=pr["created_at"],
-            )
-            session.add(cached_pr)
+        # Upsert and purge in a single transaction so the whole batch is
+        # committed with one journal sync rather than one per row
+        if rows:
+            upsert = _UPSERT_CACHED_PRS[session.get_bind().dialect.name]
+            session.execute(upsert, list(rows.values()))
+
+        session.execute(
+            _DELETE_STALE_CACHED_PRS,
+            {
+                "schedule_id": schedule_id,
+                "repositories": list(repositories),
+                "cached_at": cached_at,
+            },
+        )
 
         session.commit()
         logger.info("Cached %d PRs for schedule: %s", len(pull_requests), schedule_id)
@@ -5,13 +5,26 @@ This module provides functions for sending PR notification emails.
 
 import logging
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
 
 from pr_review_scheduler.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_EMAIL_SUBJECT = "[PR-Review] Open Pull Requests Summary"
+
+# Body of the PR summary email; repository_lines holds one "- org/repo: N open PRs\n" per repo
+SUMMARY_EMAIL_TEMPLATE = """\
+You have open pull requests that need attention.
+
+Repository Summary:
+{repository_lines}
+View details: {application_url}/
+
+---
+This is an automated message from PR-Review.
+To manage your notification settings, visit {application_url}/settings"""
+
 
 def send_notification_email(
     to_address: str,
@@ -33,24 +46,18 @@ def send_notification_email(
     logger.info("Sending email to %s: %s", to_address, subject)
 
     try:
-        # Create MIME message
-        msg = MIMEMultipart()
+        # Single-part plain text message
+        msg = EmailMessage()
         msg["From"] = settings.email_from_address
         msg["To"] = to_address
         msg["Subject"] = subject
-
-        # Attach body as plain text
-        msg.attach(MIMEText(body, "plain"))
+        msg.set_content(body)
 
         # Connect to SMTP server and send
         with smtplib.SMTP(settings.smtp2go_host, settings.smtp2go_port) as server:
             server.starttls()
             server.login(settings.smtp2go_username, settings.smtp2go_password)
-            server.sendmail(
-                settings.email_from_address,
-                to_address,
-                msg.as_string(),
-            )
+            server.send_message(msg)
 
         logger.info("Email sent successfully to %s", to_address)
         return True
@@ -73,26 +80,13 @@ def format_pr_summary_email(
     Returns:
         Tuple of (subject, body) for the email.
     """
-    subject = "[PR-Review] Open Pull Requests Summary"
-
-    body_lines = [
-        "You have open pull requests that need attention.",
-        "",
-        "Repository Summary:",
-    ]
-
-    for repo_name, pr_count in repositories.items():
-        body_lines.append(f"- {repo_name}: {pr_count} open PR{'s' if pr_count != 1 else ''}")
-
-    body_lines.extend(
-        [
-            "",
-            f"View details: {application_url}/",
-            "",
-            "---",
-            "This is an automated message from PR-Review.",
-            f"To manage your notification settings, visit {application_url}/settings",
-        ]
+    repository_lines = "".join(
+        f"- {repo_name}: {pr_count} open PR{'s' if pr_count != 1 else ''}\n"
+        for repo_name, pr_count in repositories.items()
+    )
+    body = SUMMARY_EMAIL_TEMPLATE.format(
+        repository_lines=repository_lines,
+        application_url=application_url,
     )
 
-    return subject, "\n".join(body_lines)
+    return SUMMARY_EMAIL_SUBJECT, body
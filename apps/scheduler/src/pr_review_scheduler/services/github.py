@@ -1,16 +1,39 @@
 """GitHub API service for the scheduler.
 
 This module provides functions for fetching pull request data from GitHub.
+
+All requests share one ``httpx.AsyncClient`` so keep-alive connections to
+api.github.com survive between job runs. The client is bound to a single
+event loop running in a background thread; synchronous callers (scheduler
+jobs) submit coroutines to it with ``run_coroutine``. That loop is a uvloop
+loop where uvloop is installed, and a standard asyncio loop otherwise.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Coroutine, Generator
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, TypeVar
 
 import httpx
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+
+from pr_review_scheduler.models import PullRequest
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # GitHub API configuration
 GITHUB_API_BASE = "https://api.github.com"
 GITHUB_HEADERS = {
@@ -18,85 +41,478 @@ GITHUB_HEADERS = {
     "X-GitHub-Api-Version": "2022-11-28",
 }
 
+# Check run conclusions that make a PR's checks status "fail"
+_FAILED_CONCLUSIONS = frozenset({"failure", "cancelled", "timed_out", "action_required"})
+
+# Shared event loop (run in a daemon thread) and HTTP client
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+_client: httpx.AsyncClient | None = None
+
+# Cap on GitHub requests in flight at once across all jobs. GitHub's secondary rate
+# limits penalise bursts of concurrent requests, so repository and check-run fan-out
+# queues here instead of opening a request per PR at once.
+_MAX_CONCURRENT_REQUESTS = 8
+_request_semaphore: asyncio.Semaphore | None = None
+
+# Per-token pacing against GitHub's primary rate limit: token digest -> limiter.
+# Requests are only spread out once fewer than _RATE_LIMIT_LOW_WATER remain in the window.
+_RATE_LIMITERS_MAX_ENTRIES = 512
+_RATE_LIMIT_LOW_WATER = 100
+# Longest a paced request may wait for its slot. Kept well under the notification job's
+# per-repository fetch timeout: a longer wait would only outlive the fetch waiting on it.
+_RATE_LIMIT_MAX_WAIT = 10.0
+_rate_limiters: OrderedDict[str, "_RateLimiter"] = OrderedDict()
+
+# Conditional-request cache for open PR lists: (token digest, org, repo) -> (ETag, PRs).
+# PRs are kept parsed, as (head SHA, PullRequest without checks status) pairs, rather than
+# as the much larger raw JSON. GitHub ETags vary by Authorization, so the token is part of
+# the key. A 304 response has no body and does not count against the rate limit.
+_PULLS_CACHE_MAX_ENTRIES = 512
+_CachedPulls = tuple[tuple[str, PullRequest], ...]
+_pulls_cache: OrderedDict[tuple[str, str, str], tuple[str, _CachedPulls]] = OrderedDict()
+
+# Conditional-request cache for check-run statuses, keyed like _pulls_cache plus the
+# commit SHA: (token digest, org, repo, sha) -> (ETag, aggregated status).
+_CHECKS_CACHE_MAX_ENTRIES = 4096
+_checks_cache: OrderedDict[tuple[str, str, str, str], tuple[str, str]] = OrderedDict()
+
+# Check-run statuses unlikely to change for a commit, keyed like _checks_cache, mapped to
+# (status, monotonic expiry). Once every check run on a commit has completed successfully,
+# polls skip the request until the entry expires; the expiry catches check runs registered
+# later, e.g. by a slower workflow. Failures are not memoized because failed runs are
+# commonly re-run on the same commit.
+_SETTLED_CHECKS_TTL = 600.0
+_settled_checks: OrderedDict[tuple[str, str, str, str], tuple[str, float]] = OrderedDict()
+
+# In-flight PR list fetches on the shared loop: (token digest, org, repo) -> task.
+# Schedules firing together that watch the same repository with the same token share one
+# fetch. Tokens are never shared across keys, so no schedule sees data its PAT can't read.
+_pulls_inflight: dict[tuple[str, str, str], asyncio.Task[list[PullRequest]]] = {}
+
+
+class RateLimitError(Exception):
+    """Raised when GitHub's rate limit for a token is exhausted."""
+
+    def __init__(self, reset_at: float):
+        self.reset_at = reset_at
+        super().__init__(f"GitHub rate limit exhausted until {reset_at:.0f}")
+
+
+class _RateLimiter:
+    """Paces requests for one token using GitHub's rate limit response headers.
+
+    Until GitHub has reported a budget, or once the reported window has reset,
+    requests are not delayed. When the remaining budget runs low, requests are
+    given evenly spaced send slots over the rest of the window; when it is
+    spent, or the next slot is too far off, ``RateLimitError`` is raised instead
+    of sending a request bound to fail or one nobody will wait for.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self.remaining: int | None = None
+        self.reset_at = 0.0
+        # Time the last reserved slot is sent at; the next one is spaced after it
+        self._last_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent.
+
+        Raises:
+            RateLimitError: If no requests remain before the window resets, or
+                the next free slot is more than _RATE_LIMIT_MAX_WAIT away.
+        """
+        async with self._lock:
+            if self.remaining is None:
+                return
+            now = time.time()
+            window = self.reset_at - now
+            if window <= 0:
+                self.remaining = None
+                self._last_slot = 0.0
+                return
+            if self.remaining <= 0:
+                raise RateLimitError(self.reset_at)
+            delay = 0.0
+            if self.remaining < _RATE_LIMIT_LOW_WATER:
+                slot = max(now, self._last_slot) + window / self.remaining
+                delay = slot - now
+                if delay > _RATE_LIMIT_MAX_WAIT:
+                    raise RateLimitError(self.reset_at)
+                self._last_slot = slot
+            # Reserve a request so concurrent callers don't spend the same budget
+            self.remaining -= 1
+
+        # Wait for the reserved slot without the lock, so callers queue up by slot
+        # time instead of serially behind each other's sleeps
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, response: httpx.Response) -> None:
+        """Record the budget reported by a GitHub response.
+
+        Args:
+            response: A GitHub API response.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset_at = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset_at is None:
+            return
+        self.remaining = int(remaining)
+        self.reset_at = float(reset_at)
+
+
+class _BearerAuth(httpx.Auth):
+    """httpx authentication that sends a GitHub token as a bearer credential."""
+
+    def __init__(self, access_token: str):
+        self._authorization = f"Bearer {access_token}"
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers["Authorization"] = self._authorization
+        yield request
+
+
+def _token_key(access_token: str) -> str:
+    """Derive a cache key for an access token without keeping the token itself.
+
+    Args:
+        access_token: GitHub Personal Access Token.
+
+    Returns:
+        Hex SHA-256 digest of the token.
+    """
+    return hashlib.sha256(access_token.encode()).hexdigest()
+
+
+def _remember(cache: OrderedDict[Any, Any], key: Any, value: Any, max_entries: int) -> None:
+    """Store a value in an LRU response cache, evicting the oldest entry when full.
+
+    Args:
+        cache: The cache to update.
+        key: Cache key.
+        value: Value to store.
+        max_entries: Maximum number of entries to keep.
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+def _get_rate_limiter(token_key: str) -> _RateLimiter:
+    """Get or create the rate limiter for a token.
+
+    Args:
+        token_key: Cache key for the token, from ``_token_key``.
+
+    Returns:
+        The token's rate limiter.
+    """
+    limiter = _rate_limiters.get(token_key)
+    if limiter is None:
+        limiter = _RateLimiter()
+    _remember(_rate_limiters, token_key, limiter, _RATE_LIMITERS_MAX_ENTRIES)
+    return limiter
+
+
+def _next_page_url(response: httpx.Response) -> str | None:
+    """Get the URL of the next page from a paginated GitHub response.
+
+    Args:
+        response: A GitHub API response.
+
+    Returns:
+        The ``rel="next"`` URL from the ``Link`` header, or None on the last page.
+    """
+    return response.links.get("next", {}).get("url")
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the shared event loop used for GitHub requests.
+
+    Returns:
+        The running background event loop.
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            _loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever,
+                name="github-event-loop",
+                daemon=True,
+            )
+            _loop_thread.start()
+        return _loop
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get or create the shared GitHub HTTP client.
+
+    Returns:
+        The shared HTTP/2 AsyncClient with connection pooling and keep-alive,
+        bound to the GitHub API base URL and default headers.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=GITHUB_API_BASE,
+            headers=GITHUB_HEADERS,
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=75.0,
+            ),
+        )
+    return _client
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    """Get or create the semaphore bounding concurrent GitHub requests.
+
+    Returns:
+        The shared request semaphore.
+    """
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return _request_semaphore
+
+
+async def _get(
+    url: str,
+    auth: httpx.Auth,
+    limiter: _RateLimiter,
+    headers: dict[str, str] | None = None,
+    params: dict[str, Any] | None = None,
+) -> httpx.Response:
+    """Send a GET request over the shared client, paced by the token's rate limiter.
+
+    Args:
+        url: URL or path relative to the GitHub API base.
+        auth: Authentication for the request.
+        limiter: Rate limiter for the token in ``auth``.
+        headers: Per-request headers, merged over the client defaults.
+        params: Query parameters.
+
+    Returns:
+        The HTTP response.
+
+    Raises:
+        RateLimitError: If the token's rate limit is exhausted.
+    """
+    await limiter.acquire()
+    async with _get_request_semaphore():
+        response = await _get_client().get(url, headers=headers, params=params, auth=auth)
+
+    limiter.update(response)
+    if (
+        response.status_code in (httpx.codes.FORBIDDEN, httpx.codes.TOO_MANY_REQUESTS)
+        and limiter.remaining == 0
+    ):
+        raise RateLimitError(limiter.reset_at)
+    return response
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared event loop and wait for its result.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def close_github_client() -> None:
+    """Close the shared HTTP client and stop the shared event loop.
+
+    Safe to call when nothing has been started; a later request starts
+    a fresh loop and client.
+    """
+    global _loop, _loop_thread, _client, _request_semaphore
+    with _loop_lock:
+        if _loop is None:
+            return
+
+        if _client is not None:
+            asyncio.run_coroutine_threadsafe(_client.aclose(), _loop).result()
+            _client = None
+
+        _loop.call_soon_threadsafe(_loop.stop)
+        if _loop_thread is not None:
+            _loop_thread.join()
+        _loop.close()
+        _loop = None
+        _pulls_inflight.clear()
+        _request_semaphore = None
+        _rate_limiters.clear()
+        _loop_thread = None
+        logger.info("Closed GitHub client")
+
+
+def _parse_pull_request(pr: dict[str, Any], organization: str, repository: str) -> PullRequest:
+    """Build a pull request from a GitHub pulls API object.
+
+    Args:
+        pr: Pull request object from the GitHub API.
+        organization: GitHub organization name.
+        repository: Repository name.
+
+    Returns:
+        The pull request, without a checks status.
+    """
+    return PullRequest(
+        number=pr.get("number"),
+        title=pr.get("title", ""),
+        author=pr.get("user", {}).get("login", ""),
+        author_avatar_url=pr.get("user", {}).get("avatar_url", ""),
+        labels=tuple(label.get("name", "") for label in pr.get("labels", [])),
+        checks_status=None,
+        html_url=pr.get("html_url", ""),
+        created_at=datetime.fromisoformat(pr["created_at"]),
+        organization=organization,
+        repository=repository,
+    )
+
 
 async def get_repository_pull_requests(
     access_token: str,
     organization: str,
     repository: str,
-) -> list[dict[str, Any]]:
+) -> list[PullRequest]:
     """Fetch open pull requests for a repository.
 
+    Concurrent calls for the same token and repository are coalesced into a
+    single fetch whose result every caller receives. Cancelling one caller
+    (e.g. on timeout) does not cancel the fetch for the others.
+
     Args:
         access_token: GitHub Personal Access Token.
         organization: GitHub organization name.
         repository: Repository name.
 
     Returns:
-        List of pull request data dictionaries with keys:
-        - number: PR number
-        - title: PR title
-        - author: GitHub username of the author
-        - author_avatar_url: URL to author's avatar
-        - labels: JSON string of label names
-        - checks_status: 'pass', 'fail', or 'pending'
-        - html_url: URL to the PR on GitHub
-        - created_at: ISO timestamp of PR creation
-        - organization: Organization name
-        - repository: Repository name
+        List of open pull requests, as returned by
+        ``_fetch_repository_pull_requests``.
+    """
+    key = (_token_key(access_token), organization, repository)
+    task = _pulls_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _fetch_repository_pull_requests(access_token, organization, repository)
+        )
+        _pulls_inflight[key] = task
+        task.add_done_callback(lambda _: _pulls_inflight.pop(key, None))
+    else:
+        logger.debug("Joining in-flight PR fetch for %s/%s", organization, repository)
+
+    return list(await asyncio.shield(task))
+
+
+async def _fetch_repository_pull_requests(
+    access_token: str,
+    organization: str,
+    repository: str,
+) -> list[PullRequest]:
+    """Fetch open pull requests for a repository from GitHub.
+
+    The PR list is requested conditionally with the ETag from the previous
+    fetch; on ``304 Not Modified`` the cached list is reused.
+
+    Args:
+        access_token: GitHub Personal Access Token.
+        organization: GitHub organization name.
+        repository: Repository name.
+
+    Returns:
+        List of open pull requests, each with its aggregated checks status.
+
+    Raises:
+        RateLimitError: If the token's rate limit is exhausted.
     """
     logger.info("Fetching PRs for %s/%s", organization, repository)
 
-    url = f"{GITHUB_API_BASE}/repos/{organization}/{repository}/pulls"
-    headers = {
-        **GITHUB_HEADERS,
-        "Authorization": f"Bearer {access_token}",
-    }
+    url = f"/repos/{organization}/{repository}/pulls"
+    auth = _BearerAuth(access_token)
     params = {
         "state": "open",
         "per_page": 100,
     }
 
+    token_key = _token_key(access_token)
+    limiter = _get_rate_limiter(token_key)
+    cache_key = (token_key, organization, repository)
+    cached = _pulls_cache.get(cache_key)
+    first_page_headers: dict[str, str] = {}
+    if cached is not None:
+        first_page_headers["If-None-Match"] = cached[0]
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()
+        response = await _get(url, auth, limiter, first_page_headers, params)
 
-            prs_data = response.json()
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.debug("PR list unchanged for %s/%s", organization, repository)
+            _pulls_cache.move_to_end(cache_key)
+            pulls = cached[1]
+        else:
+            response.raise_for_status()
+            prs_data = orjson.loads(response.content)
+
+            # Follow pagination for repositories with more than one page of open PRs
+            next_url = _next_page_url(response)
+            etag = None if next_url else response.headers.get("ETag")
+            while next_url:
+                response = await _get(next_url, auth, limiter)
+                response.raise_for_status()
+                prs_data.extend(orjson.loads(response.content))
+                next_url = _next_page_url(response)
+
+            pulls = tuple(
+                (
+                    pr.get("head", {}).get("sha", ""),
+                    _parse_pull_request(pr, organization, repository),
+                )
+                for pr in prs_data
+            )
 
-            result = []
-            for pr in prs_data:
-                # Get the SHA from the PR head
-                sha = pr.get("head", {}).get("sha", "")
+            # Only single-page lists are cached: a 304 for the first page says
+            # nothing about later pages
+            if etag:
+                _remember(_pulls_cache, cache_key, (etag, pulls), _PULLS_CACHE_MAX_ENTRIES)
+
+        # Get checks status for every distinct head commit concurrently over the
+        # shared client; stacked PRs can share a head SHA
+        unique_shas = list(dict.fromkeys(sha for sha, _ in pulls))
+        checks_results = await asyncio.gather(
+            *(
+                get_pull_request_checks(access_token, organization, repository, sha)
+                for sha in unique_shas
+            ),
+            return_exceptions=True,
+        )
+        status_by_sha = {}
+        for sha, checks_status in zip(unique_shas, checks_results):
+            if isinstance(checks_status, RateLimitError):
+                raise checks_status
+            if isinstance(checks_status, BaseException):
+                checks_status = "pending"
+            status_by_sha[sha] = checks_status
 
-                # Get checks status for this PR
-                checks_status = await get_pull_request_checks(
-                    access_token, organization, repository, sha
-                )
+        result = [replace(pr, checks_status=status_by_sha[sha]) for sha, pr in pulls]
 
-                # Extract label names as a JSON string
-                labels = [label.get("name", "") for label in pr.get("labels", [])]
-                labels_json = json.dumps(labels)
-
-                # Build the PR data dictionary
-                pr_data = {
-                    "number": pr.get("number"),
-                    "title": pr.get("title", ""),
-                    "author": pr.get("user", {}).get("login", ""),
-                    "author_avatar_url": pr.get("user", {}).get("avatar_url", ""),
-                    "labels": labels_json,
-                    "checks_status": checks_status,
-                    "html_url": pr.get("html_url", ""),
-                    "created_at": pr.get("created_at", ""),
-                    "organization": organization,
-                    "repository": repository,
-                }
-                result.append(pr_data)
-
-            logger.info(
-                "Found %d open PRs for %s/%s", len(result), organization, repository
-            )
-            return result
+        logger.info("Found %d open PRs for %s/%s", len(result), organization, repository)
+        return result
 
+    except RateLimitError:
+        raise
     except httpx.HTTPStatusError as e:
         logger.error(
             "HTTP error fetching PRs for %s/%s: %s", organization, repository, e
@@ -122,6 +538,10 @@ async def get_pull_request_checks(
 ) -> str:
     """Get the checks status for a pull request.
 
+    Check runs are requested conditionally with the ETag from the previous
+    fetch for the same commit; on ``304 Not Modified`` the cached status is
+    reused. Commits whose check runs have all passed are not requested again.
+
     Args:
         access_token: GitHub Personal Access Token.
         organization: GitHub organization name.
@@ -131,50 +551,67 @@ async def get_pull_request_checks(
     Returns:
         Checks status: 'pass', 'fail', or 'pending'.
         Returns 'pending' on errors.
+
+    Raises:
+        RateLimitError: If the token's rate limit is exhausted.
     """
     logger.debug("Fetching checks for %s/%s commit %s", organization, repository, sha)
 
-    url = f"{GITHUB_API_BASE}/repos/{organization}/{repository}/commits/{sha}/check-runs"
-    headers = {
-        **GITHUB_HEADERS,
-        "Authorization": f"Bearer {access_token}",
-    }
+    url = f"/repos/{organization}/{repository}/commits/{sha}/check-runs"
+    headers: dict[str, str] = {}
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
+    token_key = _token_key(access_token)
+    cache_key = (token_key, organization, repository, sha)
+    settled = _settled_checks.get(cache_key)
+    if settled is not None:
+        if settled[1] > time.monotonic():
+            _settled_checks.move_to_end(cache_key)
+            return settled[0]
+        del _settled_checks[cache_key]
 
-            data = response.json()
-            check_runs = data.get("check_runs", [])
+    cached = _checks_cache.get(cache_key)
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
 
-            # No checks means pass
-            if not check_runs:
-                return "pass"
+    try:
+        response = await _get(
+            url,
+            _BearerAuth(access_token),
+            _get_rate_limiter(token_key),
+            headers,
+            {"per_page": 100},
+        )
 
-            # Aggregate status: any failure -> "fail", any pending -> "pending", else "pass"
-            has_failure = False
-            has_pending = False
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            _checks_cache.move_to_end(cache_key)
+            return cached[1]
 
-            for check in check_runs:
-                status = check.get("status", "")
-                conclusion = check.get("conclusion")
+        response.raise_for_status()
 
-                # Check for failure (conclusion is 'failure' or similar)
-                if conclusion in ("failure", "cancelled", "timed_out", "action_required"):
-                    has_failure = True
+        data = orjson.loads(response.content)
+        check_runs = data.get("check_runs", [])
+        checks_status = _aggregate_check_runs(check_runs)
 
-                # Check for pending (status is not 'completed' or conclusion is None)
-                if status != "completed" or conclusion is None:
-                    has_pending = True
+        # A commit with no check runs yet may still have checks queued, and one with more
+        # runs than fit on a page may have a failure on a later page
+        if check_runs and checks_status == "pass" and data.get("total_count") == len(check_runs):
+            _remember(
+                _settled_checks,
+                cache_key,
+                (checks_status, time.monotonic() + _SETTLED_CHECKS_TTL),
+                _CHECKS_CACHE_MAX_ENTRIES,
+            )
+
+        etag = response.headers.get("ETag")
+        if etag:
+            _remember(
+                _checks_cache, cache_key, (etag, checks_status), _CHECKS_CACHE_MAX_ENTRIES
+            )
 
-            # Priority: failure > pending > pass
-            if has_failure:
-                return "fail"
-            if has_pending:
-                return "pending"
-            return "pass"
+        return checks_status
 
+    except RateLimitError:
+        raise
     except httpx.HTTPStatusError as e:
         logger.error(
             "HTTP error fetching checks for %s/%s: %s", organization, repository, e
@@ -190,3 +627,34 @@ async def get_pull_request_checks(
             "Unexpected error fetching checks for %s/%s: %s", organization, repository, e
         )
         return "pending"
+
+
+def _aggregate_check_runs(check_runs: list[dict[str, Any]]) -> str:
+    """Aggregate check runs for a commit into a single status.
+
+    Args:
+        check_runs: Check run objects from the GitHub check-runs API.
+
+    Returns:
+        'fail' if any check failed, else 'pending' if any check is still
+        running, else 'pass'. No checks counts as 'pass'.
+    """
+    # No checks means pass
+    if not check_runs:
+        return "pass"
+
+    # Aggregate status: any failure -> "fail", any pending -> "pending", else "pass"
+    has_pending = False
+
+    for check in check_runs:
+        conclusion = check.get("conclusion")
+
+        # Failure takes priority over everything, so stop at the first one
+        if conclusion in _FAILED_CONCLUSIONS:
+            return "fail"
+
+        # Check for pending (status is not 'completed' or conclusion is None)
+        if conclusion is None or check.get("status", "") != "completed":
+            has_pending = True
+
+    return "pending" if has_pending else "pass"
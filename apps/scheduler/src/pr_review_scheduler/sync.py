@@ -5,69 +5,121 @@ with APScheduler jobs.
 """
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from pr_review_scheduler.scheduler import add_notification_job, remove_job
-from pr_review_scheduler.services.database import get_active_schedules, get_all_schedule_ids
+from pr_review_scheduler.scheduler import add_notification_job, get_job_ids, remove_job
+from pr_review_scheduler.services.database import (
+    get_schedules_version,
+    get_schedules_with_status,
+)
 
 if TYPE_CHECKING:
     from apscheduler.schedulers.background import BackgroundScheduler
 
 logger = logging.getLogger(__name__)
 
+# Cron expression each job was last scheduled with, keyed by schedule ID
+_synced_crons: dict[str, str] = {}
 
-def sync_schedules(scheduler: "BackgroundScheduler") -> None:
+# Schedule tables fingerprint and scheduled job IDs as of the last completed sync
+_synced_version: tuple[Any, ...] | None = None
+_synced_job_ids: frozenset[str] = frozenset()
+
+
+def reset_sync_state() -> None:
+    """Forget what previous syncs recorded, so the next sync reconciles every schedule.
+
+    Call this whenever the scheduler's jobs are discarded, e.g. after
+    create_scheduler, since the recorded state describes the old jobs.
+    """
+    global _synced_version, _synced_job_ids
+
+    _synced_crons.clear()
+    _synced_version = None
+    _synced_job_ids = frozenset()
+
+
+def sync_schedules(scheduler: "BackgroundScheduler") -> int:
     """Synchronize database schedules with APScheduler jobs.
 
     This function performs the following:
-    1. Get active schedules from database
-    2. Get all schedule IDs (to detect deleted schedules)
-    3. Get current jobs from scheduler
-    4. For each active schedule: add/update job
+    1. Return early if neither the schedule tables nor the scheduled jobs have
+       changed since the last sync
+    2. Get every schedule's ID, cron expression and active flag in one query,
+       splitting out the active schedules and all schedule IDs (to detect
+       deleted schedules)
+    3. Get current job IDs from the scheduler module's index
+    4. For each active schedule without a job, or whose cron expression
+       changed since the last sync: add/replace job
     5. For each current job not in active schedules:
        - If schedule was deleted (not in all_schedule_ids): remove job
        - If schedule was deactivated (in all_ids but not active): remove job
 
+    Unchanged schedules keep their existing job, so a poll with no changes
+    does not touch the scheduler.
+
     Args:
         scheduler: The APScheduler BackgroundScheduler instance.
-    """
-    # Get active schedules from database
-    active_schedules = get_active_schedules()
-    active_schedule_ids = {schedule["id"] for schedule in active_schedules}
-
-    # Get all schedule IDs to detect deleted vs deactivated
-    all_schedule_ids = set(get_all_schedule_ids())
-
-    # Get current jobs from scheduler
-    current_jobs = scheduler.get_jobs()
-    current_job_ids = {job.id for job in current_jobs}
 
-    logger.debug(
-        "Syncing schedules: %d active, %d total in DB, %d current jobs",
-        len(active_schedule_ids),
-        len(all_schedule_ids),
-        len(current_job_ids),
-    )
-
-    # Add/update jobs for active schedules
+    Returns:
+        Number of jobs added, replaced or removed.
+    """
+    global _synced_version, _synced_job_ids
+
+    # Read the fingerprint first so changes made during this sync are picked up next time
+    version = get_schedules_version()
+
+    # Get current job IDs without walking the scheduler's job store; a fresh
+    # scheduler has none, so it is reconciled even if the fingerprint matches
+    current_job_ids = get_job_ids()
+    if version == _synced_version and current_job_ids == _synced_job_ids:
+        logger.debug("Schedules unchanged since last sync")
+        return 0
+
+    # One query for every schedule; all IDs tell deleted apart from deactivated
+    schedules = get_schedules_with_status()
+    active_schedules = [schedule for schedule in schedules if schedule["is_active"]]
+    all_schedule_ids = frozenset(schedule["id"] for schedule in schedules)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Syncing schedules: %d active, %d total in DB, %d current jobs",
+            len(active_schedules),
+            len(all_schedule_ids),
+            len(current_job_ids),
+        )
+
+    changes = 0
+    active_schedule_ids: set[str] = set()
+
+    # Add/update jobs for new or rescheduled active schedules
     for schedule in active_schedules:
         schedule_id = schedule["id"]
         cron_expression = schedule["cron_expression"]
+        active_schedule_ids.add(schedule_id)
+
+        if schedule_id in current_job_ids and _synced_crons.get(schedule_id) == cron_expression:
+            continue
 
         # add_notification_job handles both add and update (replaces if exists)
         add_notification_job(scheduler, schedule_id, cron_expression)
+        _synced_crons[schedule_id] = cron_expression
+        changes += 1
 
     # Remove jobs for schedules that are no longer active
-    for job in current_jobs:
-        job_id = job.id
-
-        if job_id not in active_schedule_ids:
-            # Job exists but schedule is not active
-            if job_id not in all_schedule_ids:
-                # Schedule was deleted from database
-                logger.info("Removing job for deleted schedule: %s", job_id)
-            else:
-                # Schedule exists but is inactive
-                logger.info("Removing job for inactive schedule: %s", job_id)
-
-            remove_job(scheduler, job_id)
+    for job_id in current_job_ids - active_schedule_ids:
+        # Job exists but schedule is not active
+        if job_id not in all_schedule_ids:
+            # Schedule was deleted from database
+            logger.info("Removing job for deleted schedule: %s", job_id)
+        else:
+            # Schedule exists but is inactive
+            logger.info("Removing job for inactive schedule: %s", job_id)
+
+        remove_job(scheduler, job_id)
+        _synced_crons.pop(job_id, None)
+        changes += 1
+
+    _synced_version = version
+    _synced_job_ids = get_job_ids()
+    return changes
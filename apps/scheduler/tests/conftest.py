@@ -1,26 +1,41 @@
 """Pytest configuration and fixtures for scheduler tests."""
 
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
 
 from pr_review_scheduler.config import get_settings
+from pr_review_scheduler.services import database
+
+# Environment shared by every settings fixture; tests override individual keys by
+# parametrizing mock_settings indirectly with a dict
+_BASE_ENV = {
+    "DATABASE_URL": "sqlite:///:memory:",
+    "ENCRYPTION_KEY": "test-encryption-key",
+    "SMTP2GO_HOST": "mail.smtp2go.com",
+    "SMTP2GO_PORT": "587",
+    "SMTP2GO_USERNAME": "test-user",
+    "SMTP2GO_PASSWORD": "test-password",
+    "EMAIL_FROM_ADDRESS": "test@example.com",
+    "APPLICATION_URL": "http://localhost:5173",
+    "SCHEDULER_TIMEZONE": "UTC",
+    "SCHEDULER_EXECUTOR_POOL_SIZE": "5",
+}
 
 
 @pytest.fixture
-def mock_settings(monkeypatch):
-    """Provide mock settings for tests."""
+def mock_settings(monkeypatch, request):
+    """Provide mock settings for tests.
+
+    Parametrize indirectly with a dict of environment variables to override
+    the defaults in ``_BASE_ENV``.
+    """
     # Clear the cached settings
     get_settings.cache_clear()
 
-    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
-    monkeypatch.setenv("ENCRYPTION_KEY", "test-encryption-key")
-    monkeypatch.setenv("SMTP2GO_HOST", "mail.smtp2go.com")
-    monkeypatch.setenv("SMTP2GO_PORT", "587")
-    monkeypatch.setenv("SMTP2GO_USERNAME", "test-user")
-    monkeypatch.setenv("SMTP2GO_PASSWORD", "test-password")
-    monkeypatch.setenv("EMAIL_FROM_ADDRESS", "test@example.com")
-    monkeypatch.setenv("APPLICATION_URL", "http://localhost:5173")
-    monkeypatch.setenv("SCHEDULER_TIMEZONE", "UTC")
-    monkeypatch.setenv("SCHEDULER_EXECUTOR_POOL_SIZE", "5")
+    overrides = getattr(request, "param", {})
+    for name, value in (_BASE_ENV | overrides).items():
+        monkeypatch.setenv(name, value)
 
     yield
 
@@ -28,24 +43,26 @@ def mock_settings(monkeypatch):
     get_settings.cache_clear()
 
 
-@pytest.fixture
-def mock_settings_different_timezone(monkeypatch):
-    """Provide mock settings with a different timezone for tests."""
-    # Clear the cached settings
-    get_settings.cache_clear()
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create an in-memory SQLite database engine with test schema, once per run."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        # One connection, so every test sees the same in-memory database
+        poolclass=StaticPool,
+    )
 
-    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
-    monkeypatch.setenv("ENCRYPTION_KEY", "test-encryption-key")
-    monkeypatch.setenv("SMTP2GO_HOST", "mail.smtp2go.com")
-    monkeypatch.setenv("SMTP2GO_PORT", "587")
-    monkeypatch.setenv("SMTP2GO_USERNAME", "test-user")
-    monkeypatch.setenv("SMTP2GO_PASSWORD", "test-password")
-    monkeypatch.setenv("EMAIL_FROM_ADDRESS", "test@example.com")
-    monkeypatch.setenv("APPLICATION_URL", "http://localhost:5173")
-    monkeypatch.setenv("SCHEDULER_TIMEZONE", "America/New_York")
-    monkeypatch.setenv("SCHEDULER_EXECUTOR_POOL_SIZE", "3")
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
 
-    yield
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-    # Clear the cache after the test
-    get_settings.cache_clear()
+    # Create tables using the models defined in database.py
+    database.Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
@@ -8,9 +8,8 @@ class TestSettings:
 
     def test_custom_settings_from_env(self, monkeypatch):
         """Test that settings are loaded from environment variables."""
-        get_settings.cache_clear()
-
         monkeypatch.setenv("DATABASE_URL", "sqlite:///./custom.db")
+        monkeypatch.setenv("SQLITE_SYNCHRONOUS", "FULL")
         monkeypatch.setenv("ENCRYPTION_KEY", "custom-key")
         monkeypatch.setenv("SMTP2GO_HOST", "custom.smtp2go.com")
         monkeypatch.setenv("SMTP2GO_PORT", "465")
@@ -19,12 +18,15 @@ class TestSettings:
         monkeypatch.setenv("EMAIL_FROM_ADDRESS", "custom@example.com")
         monkeypatch.setenv("APPLICATION_URL", "https://custom.app.com")
         monkeypatch.setenv("SCHEDULE_POLL_INTERVAL", "120")
+        monkeypatch.setenv("SCHEDULE_POLL_MAX_INTERVAL", "900")
         monkeypatch.setenv("SCHEDULER_TIMEZONE", "Europe/London")
         monkeypatch.setenv("SCHEDULER_EXECUTOR_POOL_SIZE", "20")
+        monkeypatch.setenv("SCHEDULER_EXECUTOR_KIND", "process")
 
         settings = Settings()
 
         assert settings.database_url == "sqlite:///./custom.db"
+        assert settings.sqlite_synchronous == "FULL"
         assert settings.encryption_key == "custom-key"
         assert settings.smtp2go_host == "custom.smtp2go.com"
         assert settings.smtp2go_port == 465
@@ -33,10 +35,10 @@ class TestSettings:
         assert settings.email_from_address == "custom@example.com"
         assert settings.application_url == "https://custom.app.com"
         assert settings.schedule_poll_interval == 120
+        assert settings.schedule_poll_max_interval == 900
         assert settings.scheduler_timezone == "Europe/London"
         assert settings.scheduler_executor_pool_size == 20
-
-        get_settings.cache_clear()
+        assert settings.scheduler_executor_kind == "process"
 
 
 class TestGetSettings:
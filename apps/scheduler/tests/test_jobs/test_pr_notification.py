@@ -1,8 +1,29 @@
 """Tests for the PR notification job."""
 
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+
 from pr_review_scheduler.jobs import pr_notification
+from pr_review_scheduler.services import github
+from pr_review_scheduler.services.github import RateLimitError
+
+
+def _prs_by_repository(results: dict[str, Any]):
+    """Build a get_repository_pull_requests fake keyed by repository name.
+
+    Repositories are fetched concurrently, so results can't rely on call order.
+    Exception values are raised instead of returned.
+    """
+
+    async def fake_get_prs(access_token, organization, repository):
+        result = results[repository]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    return fake_get_prs
 
 
 class TestRunNotificationJob:
@@ -32,7 +53,7 @@ class TestRunNotificationJob:
                 "title": "Feature A",
                 "author": "dev1",
                 "author_avatar_url": "https://github.com/dev1.png",
-                "labels": "[]",
+                "labels": [],
                 "checks_status": "pass",
                 "html_url": "https://github.com/myorg/frontend/pull/1",
                 "created_at": "2024-01-15T10:00:00Z",
@@ -44,7 +65,7 @@ class TestRunNotificationJob:
                 "title": "Feature B",
                 "author": "dev2",
                 "author_avatar_url": "https://github.com/dev2.png",
-                "labels": "[]",
+                "labels": [],
                 "checks_status": "pending",
                 "html_url": "https://github.com/myorg/frontend/pull/2",
                 "created_at": "2024-01-16T10:00:00Z",
@@ -58,7 +79,7 @@ class TestRunNotificationJob:
                 "title": "Bug fix",
                 "author": "dev3",
                 "author_avatar_url": "https://github.com/dev3.png",
-                "labels": '["bug"]',
+                "labels": ["bug"],
                 "checks_status": "fail",
                 "html_url": "https://github.com/myorg/backend/pull/10",
                 "created_at": "2024-01-17T10:00:00Z",
@@ -89,7 +110,9 @@ class TestRunNotificationJob:
             return_value=mock_settings,
         ):
             # Setup mock to return different PRs for different repos
-            mock_get_prs.side_effect = [mock_prs_frontend, mock_prs_backend]
+            mock_get_prs.side_effect = _prs_by_repository(
+                {"frontend": mock_prs_frontend, "backend": mock_prs_backend}
+            )
 
             pr_notification.run_notification_job("schedule-123")
 
@@ -143,13 +166,45 @@ class TestRunNotificationJob:
             "pr_review_scheduler.jobs.pr_notification.cache_pull_requests",
         ) as mock_cache, patch(
             "pr_review_scheduler.jobs.pr_notification.send_notification_email",
+        ) as mock_send_email, patch(
+            "pr_review_scheduler.jobs.pr_notification.get_settings",
+        ) as mock_get_settings:
+            pr_notification.run_notification_job("schedule-123")
+
+            # The fetched repository's cache is still replaced, dropping closed PRs
+            mock_cache.assert_called_once_with("schedule-123", [], [("myorg", "frontend")])
+
+            # Verify email was NOT sent and settings were never loaded
+            mock_send_email.assert_not_called()
+            mock_get_settings.assert_not_called()
+
+    def test_run_notification_job_no_repositories(self):
+        """Test job returns early when the schedule has no repositories."""
+        mock_schedule = {
+            "id": "schedule-123",
+            "user_id": "user-456",
+            "user_email": "user@example.com",
+            "name": "Daily PR Review",
+            "cron_expression": "0 9 * * 1-5",
+            "github_pat": "ghp_test_token",
+            "is_active": True,
+            "repositories": [],
+        }
+
+        with patch(
+            "pr_review_scheduler.jobs.pr_notification.get_schedule_by_id",
+            return_value=mock_schedule,
+        ), patch(
+            "pr_review_scheduler.jobs.pr_notification.run_coroutine",
+        ) as mock_run_coroutine, patch(
+            "pr_review_scheduler.jobs.pr_notification.cache_pull_requests",
+        ) as mock_cache, patch(
+            "pr_review_scheduler.jobs.pr_notification.send_notification_email",
         ) as mock_send_email:
             pr_notification.run_notification_job("schedule-123")
 
-            # Verify cache was NOT called (no PRs to cache)
+            mock_run_coroutine.assert_not_called()
             mock_cache.assert_not_called()
-
-            # Verify email was NOT sent
             mock_send_email.assert_not_called()
 
     def test_run_notification_job_schedule_not_found(self):
@@ -193,7 +248,7 @@ class TestRunNotificationJob:
                 "title": "Feature A",
                 "author": "dev1",
                 "author_avatar_url": "https://github.com/dev1.png",
-                "labels": "[]",
+                "labels": [],
                 "checks_status": "pass",
                 "html_url": "https://github.com/myorg/frontend/pull/1",
                 "created_at": "2024-01-15T10:00:00Z",
@@ -249,7 +304,7 @@ class TestRunNotificationJob:
                 "title": "Feature A",
                 "author": "dev1",
                 "author_avatar_url": "https://github.com/dev1.png",
-                "labels": "[]",
+                "labels": [],
                 "checks_status": "pass",
                 "html_url": "https://github.com/myorg/frontend/pull/1",
                 "created_at": "2024-01-15T10:00:00Z",
@@ -306,7 +361,7 @@ class TestRunNotificationJob:
                 "title": "Feature A",
                 "author": "dev1",
                 "author_avatar_url": "https://github.com/dev1.png",
-                "labels": "[]",
+                "labels": [],
                 "checks_status": "pass",
                 "html_url": "https://github.com/myorg/frontend/pull/1",
                 "created_at": "2024-01-15T10:00:00Z",
@@ -337,7 +392,7 @@ class TestRunNotificationJob:
             return_value=mock_settings,
         ):
             # First repo returns PRs, second returns empty (simulating error handled gracefully)
-            mock_get_prs.side_effect = [mock_prs, []]
+            mock_get_prs.side_effect = _prs_by_repository({"frontend": mock_prs, "backend": []})
 
             pr_notification.run_notification_job("schedule-123")
 
@@ -351,3 +406,145 @@ class TestRunNotificationJob:
 
             # Verify email was sent
             mock_send_email.assert_called_once()
+
+    def test_run_notification_job_repo_exception_keeps_other_repos(self):
+        """Test PRs from other repos are still cached when one fetch raises."""
+        mock_schedule = {
+            "id": "schedule-123",
+            "user_id": "user-456",
+            "user_email": "user@example.com",
+            "name": "Daily PR Review",
+            "cron_expression": "0 9 * * 1-5",
+            "github_pat": "ghp_test_token",
+            "is_active": True,
+            "repositories": [
+                {"organization": "myorg", "repository": "frontend"},
+                {"organization": "myorg", "repository": "backend"},
+            ],
+        }
+
+        mock_prs = [
+            {
+                "number": 1,
+                "title": "Feature A",
+                "author": "dev1",
+                "author_avatar_url": "https://github.com/dev1.png",
+                "labels": [],
+                "checks_status": "pass",
+                "html_url": "https://github.com/myorg/frontend/pull/1",
+                "created_at": "2024-01-15T10:00:00Z",
+                "organization": "myorg",
+                "repository": "frontend",
+            },
+        ]
+
+        mock_settings = MagicMock()
+        mock_settings.application_url = "http://localhost:5173"
+
+        with patch(
+            "pr_review_scheduler.jobs.pr_notification.get_schedule_by_id",
+            return_value=mock_schedule,
+        ), patch(
+            "pr_review_scheduler.jobs.pr_notification.get_repository_pull_requests",
+            new_callable=AsyncMock,
+        ) as mock_get_prs, patch(
+            "pr_review_scheduler.jobs.pr_notification.cache_pull_requests",
+        ) as mock_cache, patch(
+            "pr_review_scheduler.jobs.pr_notification.send_notification_email",
+            return_value=True,
+        ) as mock_send_email, patch(
+            "pr_review_scheduler.jobs.pr_notification.format_pr_summary_email",
+            return_value=("Subject", "Body"),
+        ) as mock_format, patch(
+            "pr_review_scheduler.jobs.pr_notification.get_settings",
+            return_value=mock_settings,
+        ):
+            mock_get_prs.side_effect = _prs_by_repository(
+                {"frontend": mock_prs, "backend": RuntimeError("boom")}
+            )
+
+            pr_notification.run_notification_job("schedule-123")
+
+            assert mock_get_prs.call_count == 2
+
+            # Only the successful repo is cached and summarised
+            mock_cache.assert_called_once_with("schedule-123", mock_prs, [("myorg", "frontend")])
+            pr_counts = mock_format.call_args[0][0]
+            assert pr_counts == {"myorg/frontend": 1}
+            mock_send_email.assert_called_once()
+
+    def test_run_notification_job_rate_limited_repo_is_skipped(self):
+        """Test a rate-limited repository is skipped without failing the job."""
+        mock_schedule = {
+            "id": "schedule-123",
+            "user_id": "user-456",
+            "user_email": "user@example.com",
+            "name": "Daily PR Review",
+            "cron_expression": "0 9 * * 1-5",
+            "github_pat": "ghp_test_token",
+            "is_active": True,
+            "repositories": [{"organization": "myorg", "repository": "frontend"}],
+        }
+
+        with patch(
+            "pr_review_scheduler.jobs.pr_notification.get_schedule_by_id",
+            return_value=mock_schedule,
+        ), patch(
+            "pr_review_scheduler.jobs.pr_notification.get_repository_pull_requests",
+            new_callable=AsyncMock,
+            side_effect=RateLimitError(1700000000.0),
+        ), patch(
+            "pr_review_scheduler.jobs.pr_notification.cache_pull_requests",
+        ) as mock_cache, patch(
+            "pr_review_scheduler.jobs.pr_notification.send_notification_email",
+        ) as mock_send_email:
+            pr_notification.run_notification_job("schedule-123")
+
+            mock_cache.assert_not_called()
+            mock_send_email.assert_not_called()
+
+    def test_run_notification_job_rate_limited_checks_skip_repo(self, caplog):
+        """Test a rate limit hit while fetching checks skips the repository."""
+        mock_schedule = {
+            "id": "schedule-123",
+            "user_id": "user-456",
+            "user_email": "user@example.com",
+            "name": "Daily PR Review",
+            "cron_expression": "0 9 * * 1-5",
+            "github_pat": "ghp_checks_rate_limited",
+            "is_active": True,
+            "repositories": [{"organization": "myorg", "repository": "frontend"}],
+        }
+        pulls_response = httpx.Response(
+            200,
+            json=[
+                {
+                    "number": 1,
+                    "title": "Add feature",
+                    "created_at": "2024-01-15T10:00:00Z",
+                    "head": {"sha": "abc123"},
+                }
+            ],
+            request=httpx.Request("GET", github.GITHUB_API_BASE),
+        )
+
+        with patch(
+            "pr_review_scheduler.jobs.pr_notification.get_schedule_by_id",
+            return_value=mock_schedule,
+        ), patch.object(
+            httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=pulls_response
+        ), patch(
+            "pr_review_scheduler.services.github.get_pull_request_checks",
+            new_callable=AsyncMock,
+            side_effect=RateLimitError(1700000000.0),
+        ) as mock_checks, patch(
+            "pr_review_scheduler.jobs.pr_notification.cache_pull_requests",
+        ) as mock_cache, patch(
+            "pr_review_scheduler.jobs.pr_notification.send_notification_email",
+        ) as mock_send_email:
+            pr_notification.run_notification_job("schedule-123")
+
+        mock_checks.assert_awaited_once()
+        assert "GitHub rate limit exhausted; skipping myorg/frontend" in caplog.text
+        mock_cache.assert_not_called()
+        mock_send_email.assert_not_called()
@@ -0,0 +1,60 @@
+"""Tests for the scheduler entry point."""
+
+from unittest.mock import MagicMock, patch
+
+from pr_review_scheduler import main
+
+
+def _run_polling_loop(sync_results, poll_interval=60, max_poll_interval=None):
+    """Run polling_loop for one poll per sync result and return the waits used.
+
+    Each entry in ``sync_results`` is what sync_schedules returns (or raises)
+    on that poll; the loop is stopped once they are used up.
+    """
+    waits = []
+
+    def wait(timeout):
+        waits.append(timeout)
+        return len(waits) > len(sync_results)
+
+    stop_event = MagicMock()
+    stop_event.wait.side_effect = wait
+
+    with (
+        patch.object(main, "_stop_event", stop_event),
+        patch("pr_review_scheduler.main.sync_schedules", side_effect=sync_results) as mock_sync,
+    ):
+        main.polling_loop(MagicMock(), poll_interval, max_poll_interval)
+
+    assert mock_sync.call_count == len(sync_results)
+    return waits
+
+
+class TestPollingLoop:
+    """Tests for polling_loop function."""
+
+    def test_polling_loop_doubles_interval_while_unchanged(self):
+        """Test that the wait doubles on unchanged polls, capped at the maximum."""
+        waits = _run_polling_loop([0, 0, 0, 0], poll_interval=60, max_poll_interval=300)
+
+        assert waits == [60, 120, 240, 300, 300]
+
+    def test_polling_loop_resets_interval_after_change(self):
+        """Test that a sync that changes jobs drops the wait back to the base interval."""
+        waits = _run_polling_loop([0, 0, 2, 0], poll_interval=60, max_poll_interval=600)
+
+        assert waits == [60, 120, 240, 60, 120]
+
+    def test_polling_loop_resets_interval_after_error(self):
+        """Test that a failed sync drops the wait back to the base interval."""
+        waits = _run_polling_loop(
+            [0, RuntimeError("database unavailable"), 0], poll_interval=60, max_poll_interval=600
+        )
+
+        assert waits == [60, 120, 60, 120]
+
+    def test_polling_loop_without_max_interval_does_not_back_off(self):
+        """Test that the interval stays fixed when no maximum is configured."""
+        waits = _run_polling_loop([0, 0], poll_interval=60)
+
+        assert waits == [60, 60, 60]
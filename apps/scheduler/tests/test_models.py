@@ -0,0 +1,51 @@
+"""Tests for the scheduler data types."""
+
+import dataclasses
+from datetime import UTC, datetime
+
+import pytest
+
+from pr_review_scheduler.models import PullRequest
+
+
+class TestPullRequest:
+    """Tests for the PullRequest data type."""
+
+    def test_from_dict_parses_github_values(self):
+        """Test that ISO timestamps are parsed and missing labels become empty."""
+        pr = PullRequest.from_dict(
+            {
+                "number": 1,
+                "title": "Add feature",
+                "author": "user1",
+                "labels": None,
+                "html_url": "https://github.com/org/repo/pull/1",
+                "created_at": "2024-01-15T10:00:00Z",
+                "organization": "org",
+                "repository": "repo",
+            }
+        )
+
+        assert pr.created_at == datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+        assert pr.labels == ()
+        assert pr.author_avatar_url is None
+        assert pr.checks_status is None
+
+    def test_pull_request_is_immutable(self):
+        """Test that a pull request can't be modified once built."""
+        pr = PullRequest.from_dict(
+            {
+                "number": 1,
+                "title": "Add feature",
+                "author": "user1",
+                "labels": ["bug"],
+                "html_url": "https://github.com/org/repo/pull/1",
+                "created_at": datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+                "organization": "org",
+                "repository": "repo",
+            }
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pr.title = "Changed"  # type: ignore[misc]
+        assert pr.labels == ("bug",)
@@ -1,15 +1,20 @@
 """Tests for the scheduler module."""
 
-import threading
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import Future
+from datetime import datetime
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
+from apscheduler.events import EVENT_JOB_EXECUTED
+from apscheduler.executors.pool import ProcessPoolExecutor, ThreadPoolExecutor
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 
+from pr_review_scheduler import scheduler as scheduler_module
 from pr_review_scheduler.config import get_settings
 from pr_review_scheduler.scheduler import (
     JobNotFoundError,
@@ -18,6 +23,8 @@ from pr_review_scheduler.scheduler import (
     create_scheduler,
     get_all_jobs,
     get_job,
+    get_job_count,
+    get_job_ids,
     remove_job,
     shutdown_scheduler,
     start_scheduler,
@@ -25,51 +32,108 @@ from pr_review_scheduler.scheduler import (
 )
 
 
+def _dummy_job():
+    """Do nothing; a shared target for jobs the tests never run."""
+
+
+@pytest.fixture(scope="module")
+def running_scheduler():
+    """Start one scheduler for the module rather than one per test."""
+    get_settings.cache_clear()
+    scheduler = create_scheduler()
+    start_scheduler(scheduler)
+    get_settings.cache_clear()
+
+    yield scheduler
+
+    shutdown_scheduler(scheduler, wait=False)
+
+
+@pytest.fixture
+def scheduler(running_scheduler, mock_settings):
+    """Provide the module's running scheduler, emptied of jobs after each test."""
+    yield running_scheduler
+
+    running_scheduler.remove_all_jobs()
+    scheduler_module._job_ids.clear()
+
+
 class TestCreateScheduler:
     """Tests for create_scheduler function."""
 
     def test_create_scheduler_returns_background_scheduler(self, mock_settings):
         """Test that create_scheduler returns a BackgroundScheduler instance."""
         scheduler = create_scheduler()
-        try:
-            assert isinstance(scheduler, BackgroundScheduler)
-        finally:
-            if scheduler.running:
-                scheduler.shutdown(wait=False)
+        assert isinstance(scheduler, BackgroundScheduler)
 
     def test_create_scheduler_configures_timezone(self, mock_settings):
         """Test that scheduler is configured with the correct timezone."""
         scheduler = create_scheduler()
-        try:
-            settings = get_settings()
-            expected_timezone = ZoneInfo(settings.scheduler_timezone)
-            assert scheduler.timezone == expected_timezone
-        finally:
-            if scheduler.running:
-                scheduler.shutdown(wait=False)
-
-    def test_create_scheduler_with_different_timezone(self, mock_settings_different_timezone):
+        settings = get_settings()
+        assert scheduler.timezone == ZoneInfo(settings.scheduler_timezone)
+        # create_scheduler's settings are reused rather than parsed again
+        assert get_settings.cache_info().misses == 1
+
+    @pytest.mark.parametrize(
+        "mock_settings",
+        [{"SCHEDULER_TIMEZONE": "America/New_York", "SCHEDULER_EXECUTOR_POOL_SIZE": "3"}],
+        indirect=True,
+    )
+    def test_create_scheduler_with_different_timezone(self, mock_settings):
         """Test that scheduler uses configured timezone."""
         scheduler = create_scheduler()
+        assert get_settings().scheduler_timezone == "America/New_York"
+        assert scheduler.timezone == ZoneInfo("America/New_York")
+
+    def test_create_scheduler_uses_thread_pool_by_default(self, mock_settings):
+        """Test that jobs run in a thread pool unless configured otherwise."""
+        scheduler = create_scheduler()
+        assert isinstance(scheduler._executors["default"], ThreadPoolExecutor)
+
+    @pytest.mark.parametrize(
+        "mock_settings", [{"SCHEDULER_EXECUTOR_KIND": "process"}], indirect=True
+    )
+    def test_create_scheduler_with_process_pool(self, mock_settings):
+        """Test that SCHEDULER_EXECUTOR_KIND=process selects a process pool."""
+        scheduler = create_scheduler()
+        assert isinstance(scheduler._executors["default"], ProcessPoolExecutor)
+
+    @pytest.mark.parametrize(
+        "mock_settings", [{"SCHEDULER_EXECUTOR_KIND": "process"}], indirect=True
+    )
+    def test_process_pool_runs_job_in_spawned_worker(self, mock_settings):
+        """Test that process-pool jobs run in a spawned (not forked) worker process."""
+        scheduler = create_scheduler()
+        worker_pid = Future()
+
+        def on_executed(event):
+            worker_pid.set_result(event.retval)
+
+        scheduler.add_listener(on_executed, EVENT_JOB_EXECUTED)
+        start_scheduler(scheduler)
         try:
-            settings = get_settings()
-            assert settings.scheduler_timezone == "America/New_York"
-            expected_timezone = ZoneInfo("America/New_York")
-            assert scheduler.timezone == expected_timezone
+            scheduler.add_job(
+                os.getpid, trigger=DateTrigger(run_date=datetime.now(tz=scheduler.timezone))
+            )
+
+            # Spawning a fresh interpreter is slower than a thread, so allow longer
+            assert worker_pid.result(timeout=30) != os.getpid()
+            pool = scheduler._executors["default"]._pool
+            assert pool._mp_context.get_start_method() == "spawn"
         finally:
-            if scheduler.running:
-                scheduler.shutdown(wait=False)
+            shutdown_scheduler(scheduler, wait=True)
+
+    def test_create_scheduler_uses_memory_job_store(self, mock_settings):
+        """Test that jobs are kept in memory rather than a persistent store."""
+        scheduler = create_scheduler()
+        assert isinstance(scheduler._jobstores["default"], MemoryJobStore)
 
     def test_create_scheduler_configures_job_defaults(self, mock_settings):
         """Test that scheduler has correct job defaults."""
         scheduler = create_scheduler()
-        try:
-            # Job defaults are applied when jobs are added
-            # We verify by checking the scheduler was created without errors
-            assert scheduler is not None
-        finally:
-            if scheduler.running:
-                scheduler.shutdown(wait=False)
+        # Job defaults are applied when jobs are added
+        # We verify by checking the scheduler was created without errors
+        assert scheduler is not None
 
 
 class TestStartScheduler:
@@ -85,17 +149,12 @@ class TestStartScheduler:
         finally:
             scheduler.shutdown(wait=False)
 
-    def test_start_scheduler_does_not_start_if_already_running(self, mock_settings):
+    def test_start_scheduler_does_not_start_if_already_running(self, scheduler):
         """Test that start_scheduler is idempotent."""
-        scheduler = create_scheduler()
-        try:
-            start_scheduler(scheduler)
-            assert scheduler.running
-            # Call again - should not raise
-            start_scheduler(scheduler)
-            assert scheduler.running
-        finally:
-            scheduler.shutdown(wait=False)
+        assert scheduler.running
+        # Call again - should not raise
+        start_scheduler(scheduler)
+        assert scheduler.running
 
 
 class TestShutdownScheduler:
@@ -128,430 +187,308 @@ class TestShutdownScheduler:
 class TestAddCronJob:
     """Tests for add_cron_job function."""
 
-    def test_add_cron_job_adds_job(self, mock_settings):
-        """Test that add_cron_job adds a job to the scheduler."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-
-            def dummy_job():
-                pass
-
-            job = add_cron_job(
-                scheduler,
-                job_id="test-job",
-                func=dummy_job,
-                cron_expression="0 9 * * *",  # Every day at 9 AM
-            )
-
-            assert job is not None
-            assert job.id == "test-job"
-            assert get_job(scheduler, "test-job") is not None
-        finally:
-            scheduler.shutdown(wait=False)
-
-    def test_add_cron_job_with_args(self, mock_settings):
+    @pytest.mark.parametrize(
+        ("cron_expression", "job_id"),
+        [
+            ("0 9 * * *", "test-job"),  # Every day at 9 AM
+            ("0 9 * * 1-5", "test-weekday-job"),  # Weekdays at 9 AM
+        ],
+    )
+    def test_add_cron_job_adds_job(self, scheduler, cron_expression, job_id):
+        """Test that add_cron_job adds a cron-triggered job to the scheduler."""
+        job = add_cron_job(
+            scheduler,
+            job_id=job_id,
+            func=_dummy_job,
+            cron_expression=cron_expression,
+        )
+
+        assert job.id == job_id
+        assert isinstance(job.trigger, CronTrigger)
+        assert get_job(scheduler, job_id) is not None
+
+    def test_add_cron_job_with_args(self, scheduler):
         """Test that add_cron_job passes args correctly."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-            results = []
+        results = []
 
-            def job_with_args(schedule_id):
-                results.append(schedule_id)
+        def job_with_args(schedule_id):
+            results.append(schedule_id)
 
-            job = add_cron_job(
-                scheduler,
-                job_id="test-job-args",
-                func=job_with_args,
-                cron_expression="0 9 * * *",
-                args=["schedule-123"],
-            )
+        job = add_cron_job(
+            scheduler,
+            job_id="test-job-args",
+            func=job_with_args,
+            cron_expression="0 9 * * *",
+            args=["schedule-123"],
+        )
 
-            assert job is not None
-            assert job.args == ("schedule-123",)
-        finally:
-            scheduler.shutdown(wait=False)
+        assert job is not None
+        assert job.args == ("schedule-123",)
 
-    def test_add_cron_job_with_kwargs(self, mock_settings):
+    def test_add_cron_job_with_kwargs(self, scheduler):
         """Test that add_cron_job passes kwargs correctly."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
 
-            def job_with_kwargs(schedule_id=None):
-                pass
+        def job_with_kwargs(schedule_id=None):
+            pass
 
-            job = add_cron_job(
-                scheduler,
-                job_id="test-job-kwargs",
-                func=job_with_kwargs,
-                cron_expression="0 9 * * *",
-                kwargs={"schedule_id": "schedule-456"},
-            )
+        job = add_cron_job(
+            scheduler,
+            job_id="test-job-kwargs",
+            func=job_with_kwargs,
+            cron_expression="0 9 * * *",
+            kwargs={"schedule_id": "schedule-456"},
+        )
 
-            assert job is not None
-            assert job.kwargs == {"schedule_id": "schedule-456"}
-        finally:
-            scheduler.shutdown(wait=False)
+        assert job is not None
+        assert job.kwargs == {"schedule_id": "schedule-456"}
 
-    def test_add_cron_job_replaces_existing(self, mock_settings):
+    def test_add_cron_job_replaces_existing(self, scheduler):
         """Test that add_cron_job replaces existing job by default."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-
-            def dummy_job():
-                pass
-
-            # Add first job
-            add_cron_job(
-                scheduler,
-                job_id="test-job",
-                func=dummy_job,
-                cron_expression="0 9 * * *",
-            )
-
-            # Add second job with same ID (different schedule)
+        # Add first job
+        add_cron_job(
+            scheduler,
+            job_id="test-job",
+            func=_dummy_job,
+            cron_expression="0 9 * * *",
+        )
+
+        # Add second job with same ID (different schedule)
+        add_cron_job(
+            scheduler,
+            job_id="test-job",
+            func=_dummy_job,
+            cron_expression="0 10 * * *",  # Changed to 10 AM
+            replace_existing=True,
+        )
+
+        # Should only have one job
+        jobs = get_all_jobs(scheduler)
+        assert len(jobs) == 1
+        assert jobs[0].id == "test-job"
+
+    def test_add_cron_job_invalid_cron_expression(self, scheduler):
+        """Test that add_cron_job raises ValueError for invalid cron."""
+        with pytest.raises(ValueError):
             add_cron_job(
                 scheduler,
                 job_id="test-job",
-                func=dummy_job,
-                cron_expression="0 10 * * *",  # Changed to 10 AM
-                replace_existing=True,
-            )
-
-            # Should only have one job
-            jobs = get_all_jobs(scheduler)
-            assert len(jobs) == 1
-            assert jobs[0].id == "test-job"
-        finally:
-            scheduler.shutdown(wait=False)
-
-    def test_add_cron_job_invalid_cron_expression(self, mock_settings):
-        """Test that add_cron_job raises ValueError for invalid cron."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-
-            def dummy_job():
-                pass
-
-            with pytest.raises(ValueError):
-                add_cron_job(
-                    scheduler,
-                    job_id="test-job",
-                    func=dummy_job,
-                    cron_expression="invalid cron",
-                )
-        finally:
-            scheduler.shutdown(wait=False)
-
-    def test_add_cron_job_weekday_expression(self, mock_settings):
-        """Test that add_cron_job handles weekday expressions."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-
-            def dummy_job():
-                pass
-
-            # Weekdays at 9 AM
-            job = add_cron_job(
-                scheduler,
-                job_id="test-weekday-job",
-                func=dummy_job,
-                cron_expression="0 9 * * 1-5",
+                func=_dummy_job,
+                cron_expression="invalid cron",
             )
 
-            assert job is not None
-            assert isinstance(job.trigger, CronTrigger)
-        finally:
-            scheduler.shutdown(wait=False)
-
 
 class TestGetJob:
     """Tests for get_job function."""
 
-    def test_get_job_returns_existing_job(self, mock_settings):
+    def test_get_job_returns_existing_job(self, scheduler):
         """Test that get_job returns an existing job."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-
-            def dummy_job():
-                pass
-
-            add_cron_job(
-                scheduler,
-                job_id="test-job",
-                func=dummy_job,
-                cron_expression="0 9 * * *",
-            )
-
-            job = get_job(scheduler, "test-job")
-            assert job is not None
-            assert job.id == "test-job"
-        finally:
-            scheduler.shutdown(wait=False)
-
-    def test_get_job_returns_none_for_nonexistent(self, mock_settings):
+        add_cron_job(
+            scheduler,
+            job_id="test-job",
+            func=_dummy_job,
+            cron_expression="0 9 * * *",
+        )
+
+        job = get_job(scheduler, "test-job")
+        assert job is not None
+        assert job.id == "test-job"
+
+    def test_get_job_returns_none_for_nonexistent(self, scheduler):
         """Test that get_job returns None for non-existent job."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-            job = get_job(scheduler, "nonexistent-job")
-            assert job is None
-        finally:
-            scheduler.shutdown(wait=False)
+        job = get_job(scheduler, "nonexistent-job")
+        assert job is None
 
 
 class TestGetAllJobs:
     """Tests for get_all_jobs function."""
 
-    def test_get_all_jobs_returns_empty_list(self, mock_settings):
+    def test_get_all_jobs_returns_empty_list(self, scheduler):
         """Test that get_all_jobs returns empty list when no jobs."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-            jobs = get_all_jobs(scheduler)
-            assert jobs == []
-        finally:
-            scheduler.shutdown(wait=False)
+        jobs = get_all_jobs(scheduler)
+        assert jobs == []
 
-    def test_get_all_jobs_returns_all_jobs(self, mock_settings):
+    def test_get_all_jobs_returns_all_jobs(self, scheduler):
         """Test that get_all_jobs returns all scheduled jobs."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
+        add_cron_job(scheduler, job_id="job-1", func=_dummy_job, cron_expression="0 9 * * *")
+        add_cron_job(scheduler, job_id="job-2", func=_dummy_job, cron_expression="0 10 * * *")
+        add_cron_job(scheduler, job_id="job-3", func=_dummy_job, cron_expression="0 11 * * *")
 
-            def dummy_job():
-                pass
+        jobs = get_all_jobs(scheduler)
+        assert len(jobs) == 3
+        job_ids = {job.id for job in jobs}
+        assert job_ids == {"job-1", "job-2", "job-3"}
 
-            add_cron_job(scheduler, job_id="job-1", func=dummy_job, cron_expression="0 9 * * *")
-            add_cron_job(scheduler, job_id="job-2", func=dummy_job, cron_expression="0 10 * * *")
-            add_cron_job(scheduler, job_id="job-3", func=dummy_job, cron_expression="0 11 * * *")
 
-            jobs = get_all_jobs(scheduler)
-            assert len(jobs) == 3
-            job_ids = {job.id for job in jobs}
-            assert job_ids == {"job-1", "job-2", "job-3"}
-        finally:
-            scheduler.shutdown(wait=False)
+class TestGetJobCount:
+    """Tests for get_job_count and get_job_ids functions."""
 
+    def test_get_job_count_tracks_added_and_removed_jobs(self, scheduler):
+        """Test that the job count follows adds, replacements and removals."""
+        assert get_job_count() == 0
 
-class TestRemoveJob:
-    """Tests for remove_job function."""
-
-    def test_remove_job_removes_existing_job(self, mock_settings):
-        """Test that remove_job removes an existing job."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
+        with patch("pr_review_scheduler.scheduler.run_notification_job"):
+            add_notification_job(scheduler, "job-1", "0 9 * * *")
+            add_notification_job(scheduler, "job-2", "0 10 * * *")
+            add_notification_job(scheduler, "job-2", "0 11 * * *")  # Replacement
+            assert get_job_count() == 2
 
-            def dummy_job():
-                pass
+            remove_job(scheduler, "job-1")
+            remove_job(scheduler, "job-1")  # Already removed
+            assert get_job_count() == 1
+            assert get_job_count() == len(get_all_jobs(scheduler))
+            assert get_job_ids() == {"job-2"}
 
-            add_cron_job(
-                scheduler,
-                job_id="test-job",
-                func=dummy_job,
-                cron_expression="0 9 * * *",
-            )
 
-            assert get_job(scheduler, "test-job") is not None
-            result = remove_job(scheduler, "test-job")
-            assert result is True
-            assert get_job(scheduler, "test-job") is None
-        finally:
-            scheduler.shutdown(wait=False)
+class TestRemoveJob:
+    """Tests for remove_job function."""
 
-    def test_remove_job_returns_false_for_nonexistent(self, mock_settings):
+    def test_remove_job_removes_existing_job(self, scheduler):
+        """Test that remove_job removes an existing job."""
+        add_cron_job(
+            scheduler,
+            job_id="test-job",
+            func=_dummy_job,
+            cron_expression="0 9 * * *",
+        )
+
+        assert get_job(scheduler, "test-job") is not None
+        result = remove_job(scheduler, "test-job")
+        assert result is True
+        assert get_job(scheduler, "test-job") is None
+
+    def test_remove_job_returns_false_for_nonexistent(self, scheduler):
         """Test that remove_job returns False for non-existent job."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-            result = remove_job(scheduler, "nonexistent-job")
-            assert result is False
-        finally:
-            scheduler.shutdown(wait=False)
+        result = remove_job(scheduler, "nonexistent-job")
+        assert result is False
 
 
 class TestUpdateJob:
     """Tests for update_job function."""
 
-    def test_update_job_updates_cron_expression(self, mock_settings):
+    def test_update_job_updates_cron_expression(self, scheduler):
         """Test that update_job updates the cron expression."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-
-            def dummy_job():
-                pass
-
-            add_cron_job(
-                scheduler,
-                job_id="test-job",
-                func=dummy_job,
-                cron_expression="0 9 * * *",
-            )
+        add_cron_job(
+            scheduler,
+            job_id="test-job",
+            func=_dummy_job,
+            cron_expression="0 9 * * *",
+        )
 
-            result = update_job(scheduler, "test-job", cron_expression="0 10 * * *")
-            assert result is True
+        result = update_job(scheduler, "test-job", cron_expression="0 10 * * *")
+        assert result is True
 
-            # Verify the job still exists
-            job = get_job(scheduler, "test-job")
-            assert job is not None
-        finally:
-            scheduler.shutdown(wait=False)
+        # Verify the job still exists
+        job = get_job(scheduler, "test-job")
+        assert job is not None
 
-    def test_update_job_raises_for_nonexistent(self, mock_settings):
+    def test_update_job_raises_for_nonexistent(self, scheduler):
         """Test that update_job raises JobNotFoundError for non-existent job."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-            with pytest.raises(JobNotFoundError) as exc_info:
-                update_job(scheduler, "nonexistent-job", cron_expression="0 10 * * *")
-            assert exc_info.value.job_id == "nonexistent-job"
-        finally:
-            scheduler.shutdown(wait=False)
+        with pytest.raises(JobNotFoundError) as exc_info:
+            update_job(scheduler, "nonexistent-job", cron_expression="0 10 * * *")
+        assert exc_info.value.job_id == "nonexistent-job"
 
-    def test_update_job_with_no_changes(self, mock_settings):
+    def test_update_job_with_no_changes(self, scheduler):
         """Test that update_job returns False when no update parameters provided."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
+        add_cron_job(
+            scheduler,
+            job_id="test-job",
+            func=_dummy_job,
+            cron_expression="0 9 * * *",
+        )
 
-            def dummy_job():
-                pass
-
-            add_cron_job(
-                scheduler,
-                job_id="test-job",
-                func=dummy_job,
-                cron_expression="0 9 * * *",
-            )
-
-            # Update with no cron expression - should return False (no changes made)
-            result = update_job(scheduler, "test-job")
-            assert result is False
-        finally:
-            scheduler.shutdown(wait=False)
+        # Update with no cron expression - should return False (no changes made)
+        result = update_job(scheduler, "test-job")
+        assert result is False
 
 
 class TestJobExecution:
     """Tests for job execution behavior."""
 
-    def test_job_executes_with_correct_args(self, mock_settings):
+    def test_job_executes_with_correct_args(self, scheduler):
         """Test that a job executes and receives correct arguments."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-            results = []
-            event = threading.Event()
-
-            def test_job(schedule_id):
-                results.append(schedule_id)
-                event.set()
+        result = Future()
 
-            # Use date trigger for immediate execution, aligned with scheduler timezone
-            run_time = datetime.now(tz=scheduler.timezone) + timedelta(milliseconds=100)
-            scheduler.add_job(
-                test_job,
-                trigger=DateTrigger(run_date=run_time),
-                id="immediate-job",
-                args=["test-schedule-id"],
-            )
+        def test_job(schedule_id):
+            result.set_result(schedule_id)
 
-            # Wait for job to execute
-            event.wait(timeout=2)
+        # Use date trigger for immediate execution, aligned with scheduler timezone.
+        # Adding a job to a running scheduler wakes its main loop, so it runs right away.
+        run_time = datetime.now(tz=scheduler.timezone)
+        scheduler.add_job(
+            test_job,
+            trigger=DateTrigger(run_date=run_time),
+            id="immediate-job",
+            args=["test-schedule-id"],
+        )
 
-            assert len(results) == 1
-            assert results[0] == "test-schedule-id"
-        finally:
-            scheduler.shutdown(wait=False)
+        # Wait for job to execute; the timeout only bounds a failing run
+        assert result.result(timeout=2) == "test-schedule-id"
 
-    def test_job_coalescing(self, mock_settings):
+    def test_job_coalescing(self, scheduler):
         """Test that jobs coalesce when multiple triggers fire."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
-        try:
-            # This test verifies the coalesce setting is applied
-            # by checking that the scheduler accepts the configuration
-            def dummy_job():
-                pass
+        # This test verifies the coalesce setting is applied
+        # by checking that the scheduler accepts the configuration
+        job = add_cron_job(
+            scheduler,
+            job_id="coalesce-test",
+            func=_dummy_job,
+            cron_expression="* * * * *",  # Every minute
+        )
 
-            job = add_cron_job(
-                scheduler,
-                job_id="coalesce-test",
-                func=dummy_job,
-                cron_expression="* * * * *",  # Every minute
-            )
-
-            # Verify job was added with coalesce enabled (from defaults)
-            assert job is not None
-        finally:
-            scheduler.shutdown(wait=False)
+        # Verify job was added with coalesce enabled (from defaults)
+        assert job is not None
 
 
 class TestAddNotificationJob:
     """Tests for add_notification_job function."""
 
-    def test_add_notification_job(self, mock_settings):
+    def test_add_notification_job(self, scheduler):
         """Test adding a notification job with cron expression."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
+        with patch("pr_review_scheduler.scheduler.run_notification_job"):
+            job = add_notification_job(
+                scheduler,
+                schedule_id="test-schedule-123",
+                cron_expression="0 9 * * 1-5",  # 9am weekdays
+            )
 
-        try:
-            with patch("pr_review_scheduler.scheduler.run_notification_job"):
-                job = add_notification_job(
-                    scheduler,
-                    schedule_id="test-schedule-123",
-                    cron_expression="0 9 * * 1-5",  # 9am weekdays
-                )
-
-                assert job is not None
-                assert job.id == "test-schedule-123"
-                assert isinstance(job.trigger, CronTrigger)
-
-                # Verify job can be retrieved
-                retrieved = get_job(scheduler, "test-schedule-123")
-                assert retrieved is not None
-                assert retrieved.id == job.id
-        finally:
-            shutdown_scheduler(scheduler, wait=False)
+            assert job is not None
+            assert job.id == "test-schedule-123"
+            assert isinstance(job.trigger, CronTrigger)
 
-    def test_add_notification_job_replaces_existing(self, mock_settings):
-        """Test that adding a job with same ID replaces existing."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
+            # Verify job can be retrieved
+            retrieved = get_job(scheduler, "test-schedule-123")
+            assert retrieved is not None
+            assert retrieved.id == job.id
 
-        try:
-            with patch("pr_review_scheduler.scheduler.run_notification_job"):
-                add_notification_job(scheduler, "test-123", "0 9 * * *")
-                add_notification_job(scheduler, "test-123", "0 10 * * *")  # Different time
+    def test_add_notification_job_replaces_existing(self, scheduler):
+        """Test that adding a job with same ID replaces existing."""
+        with patch("pr_review_scheduler.scheduler.run_notification_job"):
+            add_notification_job(scheduler, "test-123", "0 9 * * *")
+            add_notification_job(scheduler, "test-123", "0 10 * * *")  # Different time
 
-                jobs = scheduler.get_jobs()
-                assert len(jobs) == 1
-                assert jobs[0].id == "test-123"
-        finally:
-            shutdown_scheduler(scheduler, wait=False)
+            jobs = scheduler.get_jobs()
+            assert len(jobs) == 1
+            assert jobs[0].id == "test-123"
 
-    def test_add_notification_job_uses_configured_timezone(self, mock_settings):
+    def test_add_notification_job_uses_configured_timezone(self, scheduler):
         """Test that notification jobs use configured timezone."""
-        scheduler = create_scheduler()
-        start_scheduler(scheduler)
+        with patch("pr_review_scheduler.scheduler.run_notification_job"):
+            job = add_notification_job(
+                scheduler,
+                schedule_id="tz-test",
+                cron_expression="0 9 * * *",
+            )
 
-        try:
-            with patch("pr_review_scheduler.scheduler.run_notification_job"):
-                job = add_notification_job(
-                    scheduler,
-                    schedule_id="tz-test",
-                    cron_expression="0 9 * * *",
-                )
-
-                assert job is not None
-                # Verify the trigger has the correct timezone
-                assert job.trigger.timezone == ZoneInfo("UTC")
-        finally:
-            shutdown_scheduler(scheduler, wait=False)
+            assert job is not None
+            # Verify the trigger has the correct timezone
+            assert job.trigger.timezone == ZoneInfo("UTC")
+
+    def test_add_notification_job_shares_parsed_trigger(self, scheduler):
+        """Test that jobs with the same cron expression reuse one parsed trigger."""
+        with patch("pr_review_scheduler.scheduler.run_notification_job"):
+            job1 = add_notification_job(scheduler, "shared-1", "0 9 * * 1-5")
+            job2 = add_notification_job(scheduler, "shared-2", "0 9 * * 1-5")
+            job3 = add_notification_job(scheduler, "shared-3", "0 10 * * 1-5")
+
+            assert job1.trigger is job2.trigger
+            assert job3.trigger is not job1.trigger
@@ -1,120 +1,165 @@
 """Tests for the database service."""
 
 from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import patch
+from uuid import RFC_4122, UUID
 
 import pytest
 from pr_review_shared.encryption import encrypt_token, generate_encryption_key
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
 
+from pr_review_scheduler.config import Settings
+from pr_review_scheduler.models import PullRequest
 from pr_review_scheduler.services import database
 
+# PR creation time for cached PR payloads; the tests don't depend on its value
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=UTC)
 
-@pytest.fixture
+
+def _make_pr(number: int, title: str, **overrides: Any) -> dict[str, Any]:
+    """Build PR data for a cached PR, filling unspecified fields from a template."""
+    return {
+        "number": number,
+        "title": title,
+        "author": f"user{number}",
+        "author_avatar_url": None,
+        "labels": None,
+        "checks_status": None,
+        "html_url": f"https://github.com/org/repo/pull/{number}",
+        "created_at": _FIXED_NOW,
+        "organization": "my-org",
+        "repository": "repo-1",
+        **overrides,
+    }
+
+
+def _pull_requests(prs: list[dict]) -> list[PullRequest]:
+    """Build PullRequest objects from PR data dicts."""
+    return [PullRequest.from_dict(pr) for pr in prs]
+
+
+def _cache_prs(schedule_id: str, prs: list[dict]) -> None:
+    """Cache PR data dicts for a schedule as the full fetch of their repositories."""
+    repositories = {(pr["organization"], pr["repository"]) for pr in prs}
+    database.cache_pull_requests(schedule_id, _pull_requests(prs), repositories)
+
+
+@pytest.fixture(scope="session")
 def encryption_key() -> str:
-    """Generate an encryption key for tests."""
+    """Generate an encryption key shared by every test in the run."""
     return generate_encryption_key()
 
 
-@pytest.fixture
-def test_engine():
-    """Create an in-memory SQLite database engine with test schema."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
+@pytest.fixture(scope="session")
+def encrypted_pats(encryption_key: str) -> dict[str, str]:
+    """Encrypt the seeded schedules' PATs once for the run."""
+    return {
+        "active": encrypt_token("ghp_test_pat_12345", encryption_key),
+        "inactive": encrypt_token("ghp_inactive_pat", encryption_key),
+    }
+
+
+@pytest.fixture(scope="session")
+def test_settings(encryption_key: str) -> Settings:
+    """Build the settings the database service sees, once for the run."""
+    return Settings(
+        database_url="sqlite:///:memory:",
+        encryption_key=encryption_key,
     )
-    # Create tables using the models defined in database.py
-    database.Base.metadata.create_all(bind=engine)
-    return engine
 
 
 @pytest.fixture
 def test_session(test_engine):
-    """Create a session for the test database."""
-    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-    session = session_factory()
+    """Create a session whose changes are rolled back after the test.
+
+    The session runs inside an outer transaction; its commits only release a
+    SAVEPOINT, and sessions the service opens on the same connection join it.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection, autoflush=False, join_transaction_mode="create_savepoint"
+    )
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
-def setup_test_data(test_session: Session, encryption_key: str, monkeypatch):
+def setup_test_data(
+    test_session: Session,
+    encryption_key: str,
+    encrypted_pats: dict[str, str],
+    test_settings: Settings,
+    monkeypatch,
+):
     """Set up test data in the database."""
-    # Monkeypatch the _get_engine function to return our test engine
-    monkeypatch.setattr(
-        "pr_review_scheduler.services.database._get_engine",
-        lambda: test_session.get_bind(),
-    )
-    # Monkeypatch get_settings to return test encryption key
-    from pr_review_scheduler.config import Settings
-
-    test_settings = Settings(
-        database_url="sqlite:///:memory:",
-        encryption_key=encryption_key,
-    )
-    monkeypatch.setattr(
-        "pr_review_scheduler.services.database.get_settings",
-        lambda: test_settings,
+    # Monkeypatch the _get_engine function to return the test session's connection
+    monkeypatch.setattr(database, "_get_engine", lambda: test_session.get_bind())
+    # Monkeypatch get_settings to return the settings carrying the test encryption key
+    monkeypatch.setattr(database, "get_settings", lambda: test_settings)
+
+    # Seed with Core executemany inserts; the rows are static, so the ORM unit of
+    # work would only add overhead
+    test_user = {
+        "id": "user-123",
+        "github_username": "testuser",
+        "github_access_token": "encrypted-token",
+        "email": "testuser@example.com",
+        "avatar_url": "https://github.com/testuser.png",
+    }
+    test_session.execute(insert(database.User), [test_user])
+
+    # One active schedule with an encrypted PAT, and one inactive schedule
+    active_schedule = {
+        "id": "schedule-active-1",
+        "user_id": "user-123",
+        "name": "Daily PR Review",
+        "cron_expression": "0 9 * * 1-5",
+        "github_pat": encrypted_pats["active"],
+        "is_active": True,
+    }
+    inactive_schedule = {
+        "id": "schedule-inactive-1",
+        "user_id": "user-123",
+        "name": "Weekly Review",
+        "cron_expression": "0 10 * * 1",
+        "github_pat": encrypted_pats["inactive"],
+        "is_active": False,
+    }
+    test_session.execute(
+        insert(database.NotificationSchedule), [active_schedule, inactive_schedule]
     )
 
-    # Create test user
-    test_user = database.User(
-        id="user-123",
-        github_username="testuser",
-        github_access_token="encrypted-token",
-        email="testuser@example.com",
-        avatar_url="https://github.com/testuser.png",
-    )
-    test_session.add(test_user)
-
-    # Create active schedule with encrypted PAT
-    encrypted_pat = encrypt_token("ghp_test_pat_12345", encryption_key)
-    active_schedule = database.NotificationSchedule(
-        id="schedule-active-1",
-        user_id="user-123",
-        name="Daily PR Review",
-        cron_expression="0 9 * * 1-5",
-        github_pat=encrypted_pat,
-        is_active=True,
-    )
-    test_session.add(active_schedule)
-
-    # Add repositories to active schedule
-    repo1 = database.ScheduleRepository(
-        id="repo-1",
-        schedule_id="schedule-active-1",
-        organization="myorg",
-        repository="frontend",
-    )
-    repo2 = database.ScheduleRepository(
-        id="repo-2",
-        schedule_id="schedule-active-1",
-        organization="myorg",
-        repository="backend",
-    )
-    test_session.add_all([repo1, repo2])
-
-    # Create inactive schedule
-    encrypted_pat_inactive = encrypt_token("ghp_inactive_pat", encryption_key)
-    inactive_schedule = database.NotificationSchedule(
-        id="schedule-inactive-1",
-        user_id="user-123",
-        name="Weekly Review",
-        cron_expression="0 10 * * 1",
-        github_pat=encrypted_pat_inactive,
-        is_active=False,
-    )
-    test_session.add(inactive_schedule)
-
-    # Add repository to inactive schedule
-    repo3 = database.ScheduleRepository(
-        id="repo-3",
-        schedule_id="schedule-inactive-1",
-        organization="otherorg",
-        repository="project",
+    # Two repositories for the active schedule, one for the inactive schedule
+    test_session.execute(
+        insert(database.ScheduleRepository),
+        [
+            {
+                "id": "repo-1",
+                "schedule_id": "schedule-active-1",
+                "organization": "myorg",
+                "repository": "frontend",
+            },
+            {
+                "id": "repo-2",
+                "schedule_id": "schedule-active-1",
+                "organization": "myorg",
+                "repository": "backend",
+            },
+            {
+                "id": "repo-3",
+                "schedule_id": "schedule-inactive-1",
+                "organization": "otherorg",
+                "repository": "project",
+            },
+        ],
     )
-    test_session.add(repo3)
 
+    # Releases the test session's SAVEPOINT, so service sessions see plain queries
     test_session.commit()
 
     return {
@@ -125,93 +170,68 @@ def setup_test_data(test_session: Session, encryption_key: str, monkeypatch):
     }
 
 
-class TestGetActiveSchedules:
-    """Tests for get_active_schedules function."""
-
-    def test_get_active_schedules_returns_only_active(self, setup_test_data):
-        """Verify that only active schedules are returned."""
-        schedules = database.get_active_schedules()
+class TestGenerateUuid:
+    """Tests for generate_uuid function."""
 
-        assert len(schedules) == 1
-        assert schedules[0]["id"] == "schedule-active-1"
-        assert schedules[0]["is_active"] is True
+    def test_generates_version_7_uuid(self):
+        """Test that generated IDs are RFC 4122 version 7 UUIDs."""
+        value = UUID(database.generate_uuid())
 
-    def test_get_active_schedules_includes_decrypted_pat(self, setup_test_data):
-        """Verify that the PAT is decrypted in the returned schedule."""
-        schedules = database.get_active_schedules()
+        assert value.version == 7
+        assert value.variant == RFC_4122
 
-        assert len(schedules) == 1
-        assert schedules[0]["github_pat"] == "ghp_test_pat_12345"
+    def test_ids_sort_by_creation_time(self):
+        """Test that IDs from later milliseconds sort after earlier ones."""
+        with patch("pr_review_scheduler.services.database.time.time_ns") as mock_time_ns:
+            mock_time_ns.side_effect = [1_000_000_000_000, 1_000_001_000_000]
+            first = database.generate_uuid()
+            second = database.generate_uuid()
 
-    def test_get_active_schedules_includes_repositories(self, setup_test_data):
-        """Verify that repositories are included in the returned schedule."""
-        schedules = database.get_active_schedules()
+        assert first < second
 
-        assert len(schedules) == 1
-        repositories = schedules[0]["repositories"]
-        assert len(repositories) == 2
 
-        # Check repository data structure
-        repo_names = {(r["organization"], r["repository"]) for r in repositories}
-        assert ("myorg", "frontend") in repo_names
-        assert ("myorg", "backend") in repo_names
+class TestGetEngine:
+    """Tests for _get_engine function."""
 
-    def test_get_active_schedules_includes_user_email(self, setup_test_data):
-        """Verify that user email is included in the returned schedule."""
-        schedules = database.get_active_schedules()
-
-        assert len(schedules) == 1
-        assert schedules[0]["user_email"] == "testuser@example.com"
-
-    def test_get_active_schedules_correct_structure(self, setup_test_data):
-        """Verify the complete structure of returned schedule dictionaries."""
-        schedules = database.get_active_schedules()
-
-        assert len(schedules) == 1
-        schedule = schedules[0]
-
-        # Check all required keys are present
-        required_keys = {
-            "id",
-            "user_id",
-            "user_email",
-            "name",
-            "cron_expression",
-            "github_pat",
-            "is_active",
-            "repositories",
-        }
-        assert set(schedule.keys()) >= required_keys
+    def test_get_engine_applies_sqlite_pragmas(self, tmp_path, monkeypatch):
+        """Verify that SQLite connections use WAL with the configured synchronous level."""
+        test_settings = Settings(
+            database_url=f"sqlite:///{tmp_path / 'pragmas.db'}",
+            sqlite_synchronous="NORMAL",
+        )
+        monkeypatch.setattr(database, "get_settings", lambda: test_settings)
+        monkeypatch.setattr(database, "_engine", None)
 
-        # Check values
-        assert schedule["id"] == "schedule-active-1"
-        assert schedule["user_id"] == "user-123"
-        assert schedule["user_email"] == "testuser@example.com"
-        assert schedule["name"] == "Daily PR Review"
-        assert schedule["cron_expression"] == "0 9 * * 1-5"
-        assert schedule["is_active"] is True
+        engine = database._get_engine()
+        try:
+            with engine.connect() as conn:
+                assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+                # NORMAL == 1
+                assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+                assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+        finally:
+            engine.dispose()
 
 
 class TestGetScheduleById:
     """Tests for get_schedule_by_id function."""
 
-    def test_get_schedule_by_id_active(self, setup_test_data):
-        """Verify that an active schedule can be retrieved by ID."""
-        schedule = database.get_schedule_by_id("schedule-active-1")
-
-        assert schedule is not None
-        assert schedule["id"] == "schedule-active-1"
-        assert schedule["name"] == "Daily PR Review"
-        assert schedule["github_pat"] == "ghp_test_pat_12345"
-
-    def test_get_schedule_by_id_inactive(self, setup_test_data):
-        """Verify that an inactive schedule can be retrieved by ID."""
-        schedule = database.get_schedule_by_id("schedule-inactive-1")
+    @pytest.mark.parametrize(
+        ("schedule_id", "name", "github_pat", "is_active"),
+        [
+            ("schedule-active-1", "Daily PR Review", "ghp_test_pat_12345", True),
+            ("schedule-inactive-1", "Weekly Review", "ghp_inactive_pat", False),
+        ],
+    )
+    def test_get_schedule_by_id(self, setup_test_data, schedule_id, name, github_pat, is_active):
+        """Verify that active and inactive schedules can be retrieved by ID."""
+        schedule = database.get_schedule_by_id(schedule_id)
 
         assert schedule is not None
-        assert schedule["id"] == "schedule-inactive-1"
-        assert schedule["name"] == "Weekly Review"
-        assert schedule["is_active"] is False
+        assert schedule["id"] == schedule_id
+        assert schedule["name"] == name
+        assert schedule["github_pat"] == github_pat
+        assert schedule["is_active"] is is_active
 
     def test_get_schedule_by_id_not_found(self, setup_test_data):
         """Verify that None is returned for non-existent schedule."""
@@ -226,6 +246,46 @@ class TestGetScheduleById:
         assert schedule is not None
         assert len(schedule["repositories"]) == 2
 
+    def test_get_schedule_by_id_correct_structure(self, setup_test_data):
+        """Verify the complete structure of the returned schedule dictionary."""
+        schedule = database.get_schedule_by_id("schedule-active-1")
+        repositories = schedule.pop("repositories")
+
+        assert schedule == {
+            "id": "schedule-active-1",
+            "user_id": "user-123",
+            "user_email": "testuser@example.com",
+            "name": "Daily PR Review",
+            "cron_expression": "0 9 * * 1-5",
+            "github_pat": "ghp_test_pat_12345",
+            "is_active": True,
+        }
+        assert {(r["organization"], r["repository"]) for r in repositories} == {
+            ("myorg", "frontend"),
+            ("myorg", "backend"),
+        }
+
+    def test_get_schedule_by_id_uses_two_queries(
+        self, setup_test_data, test_session: Session
+    ):
+        """Verify that the schedule's user and repositories load without lazy loads."""
+        statements = []
+        engine = test_session.get_bind()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            schedule = database.get_schedule_by_id("schedule-active-1")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert schedule["user_email"] == "testuser@example.com"
+        assert len(schedule["repositories"]) == 2
+        # One query for the schedule joined to its user, one for its repositories
+        assert len(statements) == 2
+
 
 class TestGetUserEmail:
     """Tests for get_user_email function."""
@@ -243,43 +303,126 @@ class TestGetUserEmail:
         assert email is None
 
 
-class TestGetAllScheduleIds:
-    """Tests for get_all_schedule_ids function."""
+class TestGetSchedulesWithStatus:
+    """Tests for get_schedules_with_status function."""
+
+    def test_get_schedules_with_status_returns_all(self, setup_test_data):
+        """Verify that active and inactive schedules are both returned with their flag."""
+        schedules = database.get_schedules_with_status()
+
+        assert sorted(schedules, key=lambda s: s["id"]) == [
+            {"id": "schedule-active-1", "cron_expression": "0 9 * * 1-5", "is_active": True},
+            {"id": "schedule-inactive-1", "cron_expression": "0 10 * * 1", "is_active": False},
+        ]
+
+    def test_get_schedules_with_status_without_repositories_is_inactive(
+        self, setup_test_data, test_session: Session
+    ):
+        """Verify that an active schedule with no repositories is reported inactive."""
+        test_session.add(
+            database.NotificationSchedule(
+                id="schedule-no-repos",
+                user_id="user-123",
+                name="Empty",
+                cron_expression="0 8 * * *",
+                github_pat="unused",
+                is_active=True,
+            )
+        )
+        test_session.commit()
+
+        statuses = {s["id"]: s["is_active"] for s in database.get_schedules_with_status()}
+
+        assert statuses["schedule-no-repos"] is False
+
+    def test_get_schedules_with_status_uses_one_query(
+        self, setup_test_data, test_session: Session
+    ):
+        """Verify that statuses come from a single SELECT."""
+        statements = []
+        engine = test_session.get_bind()
 
-    def test_get_all_schedule_ids_returns_all(self, setup_test_data):
-        """Verify that all schedule IDs are returned (active and inactive)."""
-        schedule_ids = database.get_all_schedule_ids()
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
 
-        assert len(schedule_ids) == 2
-        assert "schedule-active-1" in schedule_ids
-        assert "schedule-inactive-1" in schedule_ids
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            database.get_schedules_with_status()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+
+
+class TestGetSchedulesVersion:
+    """Tests for get_schedules_version function."""
+
+    def test_get_schedules_version_changes_with_schedules(
+        self, setup_test_data, test_session: Session
+    ):
+        """Verify the version changes when a schedule or its repositories change."""
+        version = database.get_schedules_version()
+        assert version[0] == 2
+        assert version[2] == 3
+
+        schedule = test_session.get(database.NotificationSchedule, "schedule-active-1")
+        schedule.cron_expression = "0 10 * * *"
+        test_session.commit()
+        edited = database.get_schedules_version()
+        assert edited != version
+
+        test_session.delete(schedule.repositories[0])
+        test_session.commit()
+        assert database.get_schedules_version()[2] == 2
+
+        assert database.get_schedules_version() == database.get_schedules_version()
+
+
+class TestDecryptPat:
+    """Tests for PAT decryption memoization."""
+
+    def test_get_schedule_by_id_decrypts_pat_once(self, setup_test_data):
+        """Verify that repeated loads of a schedule reuse the decrypted PAT."""
+        database.invalidate_pat_cache()
+
+        with patch.object(
+            database, "decrypt_token", wraps=database.decrypt_token
+        ) as mock_decrypt:
+            first = database.get_schedule_by_id("schedule-active-1")
+            second = database.get_schedule_by_id("schedule-active-1")
+
+        assert first["github_pat"] == second["github_pat"] == "ghp_test_pat_12345"
+        mock_decrypt.assert_called_once()
+
+    def test_invalidate_pat_cache_forces_decryption(self, setup_test_data):
+        """Verify that invalidating the cache makes the next load decrypt again."""
+        database.get_schedule_by_id("schedule-active-1")
+        database.invalidate_pat_cache()
+
+        with patch.object(
+            database, "decrypt_token", wraps=database.decrypt_token
+        ) as mock_decrypt:
+            database.get_schedule_by_id("schedule-active-1")
+
+        mock_decrypt.assert_called_once()
 
 
 class TestDecryptionErrorHandling:
     """Tests for decryption error handling."""
 
-    def test_get_active_schedules_skips_invalid_pat(
-        self, test_session: Session, monkeypatch
-    ):
-        """Verify that schedules with invalid PATs are skipped gracefully."""
+    @pytest.fixture
+    def bad_pat_schedule(self, test_session: Session, monkeypatch) -> str:
+        """Seed an active schedule whose PAT was encrypted with a different key."""
         # Monkeypatch engine
-        monkeypatch.setattr(
-            "pr_review_scheduler.services.database._get_engine",
-            lambda: test_session.get_bind(),
-        )
+        monkeypatch.setattr(database, "_get_engine", lambda: test_session.get_bind())
 
         # Generate a different encryption key for settings (wrong key)
         wrong_key = generate_encryption_key()
-        from pr_review_scheduler.config import Settings
-
         test_settings = Settings(
             database_url="sqlite:///:memory:",
             encryption_key=wrong_key,
         )
-        monkeypatch.setattr(
-            "pr_review_scheduler.services.database.get_settings",
-            lambda: test_settings,
-        )
+        monkeypatch.setattr(database, "get_settings", lambda: test_settings)
 
         # Create user
         test_user = database.User(
@@ -305,9 +448,18 @@ class TestDecryptionErrorHandling:
         test_session.add(bad_schedule)
         test_session.commit()
 
-        # Should return empty list (skipped due to decryption error)
-        schedules = database.get_active_schedules()
-        assert all(s["id"] != "schedule-bad-pat" for s in schedules)
+        return encrypted_pat
+
+    def test_get_schedule_by_id_invalid_pat(self, bad_pat_schedule):
+        """Verify that a schedule with an invalid PAT is reported as not found."""
+        with patch.object(database, "_decrypt_pat", wraps=database._decrypt_pat) as mock_decrypt:
+            schedule = database.get_schedule_by_id("schedule-bad-pat")
+
+        # Decryption was attempted and failed
+        mock_decrypt.assert_called_once_with(
+            bad_pat_schedule, database.get_settings().encryption_key
+        )
+        assert schedule is None
 
 
 class TestCachePullRequests:
@@ -317,21 +469,16 @@ class TestCachePullRequests:
         """Test caching PR data."""
         # Create PR data
         prs = [
-            {
-                "number": 1,
-                "title": "Add feature",
-                "author": "user1",
-                "author_avatar_url": "https://avatar.png",
-                "labels": '[{"name": "bug", "color": "red"}]',
-                "checks_status": "pass",
-                "html_url": "https://github.com/org/repo/pull/1",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-1",
-            }
+            _make_pr(
+                1,
+                "Add feature",
+                author_avatar_url="https://avatar.png",
+                labels=["bug"],
+                checks_status="pass",
+            )
         ]
 
-        database.cache_pull_requests("schedule-active-1", prs)
+        _cache_prs("schedule-active-1", prs)
 
         # Verify cached
         cached = (
@@ -344,7 +491,7 @@ class TestCachePullRequests:
         assert cached[0].title == "Add feature"
         assert cached[0].author == "user1"
         assert cached[0].author_avatar_url == "https://avatar.png"
-        assert cached[0].labels == '[{"name": "bug", "color": "red"}]'
+        assert cached[0].labels == ["bug"]
         assert cached[0].checks_status == "pass"
         assert cached[0].html_url == "https://github.com/org/repo/pull/1"
         assert cached[0].organization == "my-org"
@@ -356,20 +503,9 @@ class TestCachePullRequests:
         """Test that caching replaces existing cached PRs."""
         # Add initial PR
         initial = [
-            {
-                "number": 1,
-                "title": "Old PR",
-                "author": "user1",
-                "author_avatar_url": "https://avatar1.png",
-                "labels": None,
-                "checks_status": "pending",
-                "html_url": "https://github.com/org/repo/pull/1",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-1",
-            }
+            _make_pr(1, "Old PR", author_avatar_url="https://avatar1.png", checks_status="pending")
         ]
-        database.cache_pull_requests("schedule-active-1", initial)
+        _cache_prs("schedule-active-1", initial)
 
         # Verify initial PR cached
         cached = (
@@ -383,20 +519,15 @@ class TestCachePullRequests:
 
         # Replace with new PR
         new = [
-            {
-                "number": 2,
-                "title": "New PR",
-                "author": "user2",
-                "author_avatar_url": "https://avatar2.png",
-                "labels": '[{"name": "feature", "color": "blue"}]',
-                "checks_status": "pass",
-                "html_url": "https://github.com/org/repo/pull/2",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-1",
-            }
+            _make_pr(
+                2,
+                "New PR",
+                author_avatar_url="https://avatar2.png",
+                labels=["feature"],
+                checks_status="pass",
+            )
         ]
-        database.cache_pull_requests("schedule-active-1", new)
+        _cache_prs("schedule-active-1", new)
 
         # Verify only new PR exists
         cached = (
@@ -413,45 +544,27 @@ class TestCachePullRequests:
     ):
         """Test caching multiple PRs at once."""
         prs = [
-            {
-                "number": 1,
-                "title": "First PR",
-                "author": "user1",
-                "author_avatar_url": None,
-                "labels": None,
-                "checks_status": None,
-                "html_url": "https://github.com/org/repo/pull/1",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-1",
-            },
-            {
-                "number": 2,
-                "title": "Second PR",
-                "author": "user2",
-                "author_avatar_url": "https://avatar2.png",
-                "labels": '[{"name": "bug", "color": "red"}]',
-                "checks_status": "fail",
-                "html_url": "https://github.com/org/repo/pull/2",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-2",
-            },
-            {
-                "number": 3,
-                "title": "Third PR",
-                "author": "user3",
-                "author_avatar_url": "https://avatar3.png",
-                "labels": None,
-                "checks_status": "pass",
-                "html_url": "https://github.com/org/other-repo/pull/3",
-                "created_at": datetime.now(UTC),
-                "organization": "other-org",
-                "repository": "other-repo",
-            },
+            _make_pr(1, "First PR"),
+            _make_pr(
+                2,
+                "Second PR",
+                author_avatar_url="https://avatar2.png",
+                labels=["bug"],
+                checks_status="fail",
+                repository="repo-2",
+            ),
+            _make_pr(
+                3,
+                "Third PR",
+                author_avatar_url="https://avatar3.png",
+                checks_status="pass",
+                html_url="https://github.com/org/other-repo/pull/3",
+                organization="other-org",
+                repository="other-repo",
+            ),
         ]
 
-        database.cache_pull_requests("schedule-active-1", prs)
+        _cache_prs("schedule-active-1", prs)
 
         # Verify all PRs cached
         cached = (
@@ -463,26 +576,66 @@ class TestCachePullRequests:
         pr_numbers = {pr.pr_number for pr in cached}
         assert pr_numbers == {1, 2, 3}
 
+    @pytest.mark.parametrize("count", [1, 100])
+    def test_cache_pull_requests_writes_in_one_statement(
+        self, setup_test_data, test_session: Session, count
+    ):
+        """Test that any number of PRs is written with a single executemany INSERT."""
+        inserts = []
+        engine = test_session.get_bind()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                inserts.append(statement)
+
+        prs = [_make_pr(number, f"PR {number}") for number in range(1, count + 1)]
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            _cache_prs("schedule-active-1", prs)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(inserts) == 1
+        assert (
+            test_session.query(database.CachedPullRequest)
+            .filter_by(schedule_id="schedule-active-1")
+            .count()
+            == count
+        )
+
+    def test_cache_pull_requests_updates_open_prs_in_place(
+        self, setup_test_data, test_session: Session
+    ):
+        """Test that re-caching a still-open PR updates its row rather than replacing it."""
+        pr = _make_pr(1, "Add feature", checks_status="pending")
+        _cache_prs("schedule-active-1", [pr])
+        original_id = (
+            test_session.query(database.CachedPullRequest.id)
+            .filter_by(schedule_id="schedule-active-1")
+            .scalar()
+        )
+
+        # The same PR listed twice is written once
+        updated = {**pr, "checks_status": "pass"}
+        _cache_prs("schedule-active-1", [updated, updated])
+
+        test_session.expire_all()
+        cached = (
+            test_session.query(database.CachedPullRequest)
+            .filter_by(schedule_id="schedule-active-1")
+            .all()
+        )
+        assert len(cached) == 1
+        assert cached[0].id == original_id
+        assert cached[0].checks_status == "pass"
+
     def test_cache_pull_requests_empty_list(
         self, setup_test_data, test_session: Session
     ):
         """Test caching an empty list of PRs clears existing cache."""
         # First, add a PR
-        prs = [
-            {
-                "number": 1,
-                "title": "PR to be cleared",
-                "author": "user1",
-                "author_avatar_url": None,
-                "labels": None,
-                "checks_status": None,
-                "html_url": "https://github.com/org/repo/pull/1",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-1",
-            }
-        ]
-        database.cache_pull_requests("schedule-active-1", prs)
+        prs = [_make_pr(1, "PR to be cleared")]
+        _cache_prs("schedule-active-1", prs)
 
         # Verify PR is cached
         cached = (
@@ -493,7 +646,7 @@ class TestCachePullRequests:
         assert len(cached) == 1
 
         # Cache empty list
-        database.cache_pull_requests("schedule-active-1", [])
+        database.cache_pull_requests("schedule-active-1", [], [("my-org", "repo-1")])
 
         # Verify cache is cleared
         cached = (
@@ -503,43 +656,36 @@ class TestCachePullRequests:
         )
         assert len(cached) == 0
 
+    def test_cache_pull_requests_keeps_unfetched_repositories(
+        self, setup_test_data, test_session: Session
+    ):
+        """Test that cached PRs of a repository missing from this fetch are kept."""
+        _cache_prs(
+            "schedule-active-1",
+            [_make_pr(1, "Repo 1 PR"), _make_pr(2, "Repo 2 PR", repository="repo-2")],
+        )
+
+        # repo-2 failed to fetch this time; repo-1's PR has closed
+        database.cache_pull_requests("schedule-active-1", [], [("my-org", "repo-1")])
+
+        cached = (
+            test_session.query(database.CachedPullRequest)
+            .filter_by(schedule_id="schedule-active-1")
+            .all()
+        )
+        assert [(pr.repository, pr.pr_number) for pr in cached] == [("repo-2", 2)]
+
     def test_cache_pull_requests_different_schedules_isolated(
         self, setup_test_data, test_session: Session
     ):
         """Test that caching for one schedule doesn't affect another."""
         # Cache PR for schedule-active-1
-        prs_active = [
-            {
-                "number": 1,
-                "title": "Active Schedule PR",
-                "author": "user1",
-                "author_avatar_url": None,
-                "labels": None,
-                "checks_status": None,
-                "html_url": "https://github.com/org/repo/pull/1",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-1",
-            }
-        ]
-        database.cache_pull_requests("schedule-active-1", prs_active)
+        prs_active = [_make_pr(1, "Active Schedule PR")]
+        _cache_prs("schedule-active-1", prs_active)
 
         # Cache PR for schedule-inactive-1
-        prs_inactive = [
-            {
-                "number": 2,
-                "title": "Inactive Schedule PR",
-                "author": "user2",
-                "author_avatar_url": None,
-                "labels": None,
-                "checks_status": None,
-                "html_url": "https://github.com/org/repo/pull/2",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-1",
-            }
-        ]
-        database.cache_pull_requests("schedule-inactive-1", prs_inactive)
+        prs_inactive = [_make_pr(2, "Inactive Schedule PR")]
+        _cache_prs("schedule-inactive-1", prs_inactive)
 
         # Verify each schedule has its own cached PRs
         cached_active = (
@@ -562,21 +708,8 @@ class TestCachePullRequests:
         assert cached_inactive[0].title == "Inactive Schedule PR"
 
         # Now replace schedule-active-1's cache
-        new_prs = [
-            {
-                "number": 3,
-                "title": "Replaced PR",
-                "author": "user3",
-                "author_avatar_url": None,
-                "labels": None,
-                "checks_status": None,
-                "html_url": "https://github.com/org/repo/pull/3",
-                "created_at": datetime.now(UTC),
-                "organization": "my-org",
-                "repository": "repo-1",
-            }
-        ]
-        database.cache_pull_requests("schedule-active-1", new_prs)
+        new_prs = [_make_pr(3, "Replaced PR")]
+        _cache_prs("schedule-active-1", new_prs)
 
         # Verify schedule-inactive-1's cache is unaffected
         cached_inactive = (
@@ -105,15 +105,16 @@ class TestSendNotificationEmail:
                 mock_settings.smtp2go_username, mock_settings.smtp2go_password
             )
 
-            # Verify sendmail was called
-            mock_server.sendmail.assert_called_once()
-            call_args = mock_server.sendmail.call_args
-            assert call_args[0][0] == mock_settings.email_from_address
-            assert call_args[0][1] == "recipient@example.com"
-            # Message should contain subject and body
-            msg_string = call_args[0][2]
-            assert "Test Subject" in msg_string
-            assert "Test body content" in msg_string
+            # Verify send_message was called
+            mock_server.send_message.assert_called_once()
+            msg = mock_server.send_message.call_args[0][0]
+            assert msg["From"] == mock_settings.email_from_address
+            assert msg["To"] == "recipient@example.com"
+            # Message should contain subject and a plain-text body
+            assert msg["Subject"] == "Test Subject"
+            assert not msg.is_multipart()
+            assert msg.get_content_type() == "text/plain"
+            assert msg.get_content().strip() == "Test body content"
 
     def test_send_notification_email_smtp_error(self):
         """Verify returns False on SMTP error."""
@@ -177,8 +178,8 @@ class TestSendNotificationEmail:
             # Verify result is False on error
             assert result is False
 
-    def test_send_notification_email_sendmail_error(self):
-        """Verify returns False on sendmail failure."""
+    def test_send_notification_email_send_message_error(self):
+        """Verify returns False on send_message failure."""
         with patch(
             "pr_review_scheduler.services.email.get_settings"
         ) as mock_get_settings, patch(
@@ -193,10 +194,10 @@ class TestSendNotificationEmail:
             mock_settings.email_from_address = "noreply@example.com"
             mock_get_settings.return_value = mock_settings
 
-            # Configure mock SMTP server to fail on sendmail
+            # Configure mock SMTP server to fail on send_message
             mock_server = MagicMock()
             mock_smtp.return_value.__enter__.return_value = mock_server
-            mock_server.sendmail.side_effect = Exception("Failed to send email")
+            mock_server.send_message.side_effect = Exception("Failed to send email")
 
             # Call function
             result = send_notification_email(
@@ -1,5 +1,10 @@
 """Tests for the GitHub API service."""
 
+import asyncio
+import time
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -8,6 +13,131 @@ import pytest
 from pr_review_scheduler.services import github
 
 
+def _json_response(
+    data: Any, status_code: int = 200, headers: dict[str, str] | None = None
+) -> httpx.Response:
+    """Build a GitHub API response carrying a JSON body."""
+    return httpx.Response(
+        status_code,
+        json=data,
+        headers=headers,
+        request=httpx.Request("GET", github.GITHUB_API_BASE),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_github_caches():
+    """Start each test with empty GitHub response caches."""
+    github._pulls_cache.clear()
+    github._checks_cache.clear()
+    github._settled_checks.clear()
+    github._pulls_inflight.clear()
+    github._request_semaphore = None
+    github._rate_limiters.clear()
+    yield
+    github._pulls_cache.clear()
+    github._checks_cache.clear()
+    github._settled_checks.clear()
+    github._pulls_inflight.clear()
+    github._request_semaphore = None
+    github._rate_limiters.clear()
+
+
+class TestSharedEventLoop:
+    """Tests for the shared event loop and HTTP client."""
+
+    def test_run_coroutine_returns_result(self):
+        """Test that run_coroutine runs a coroutine from synchronous code."""
+
+        async def add(a, b):
+            return a + b
+
+        try:
+            assert github.run_coroutine(add(1, 2)) == 3
+        finally:
+            github.close_github_client()
+
+    def test_run_coroutine_reuses_loop_and_client(self):
+        """Test that consecutive runs share one event loop and one HTTP client."""
+
+        async def current():
+            return asyncio.get_running_loop(), github._get_client()
+
+        try:
+            loop1, client1 = github.run_coroutine(current())
+            loop2, client2 = github.run_coroutine(current())
+
+            assert loop1 is loop2
+            assert client1 is client2
+        finally:
+            github.close_github_client()
+
+    def test_shared_loop_uses_uvloop_when_available(self):
+        """Test that the background loop is a uvloop loop when uvloop is installed."""
+        uvloop = pytest.importorskip("uvloop")
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        try:
+            assert isinstance(github.run_coroutine(current_loop()), uvloop.Loop)
+        finally:
+            github.close_github_client()
+
+    def test_shared_loop_falls_back_to_asyncio(self):
+        """Test that a standard asyncio loop is used when uvloop is missing."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        try:
+            with patch("pr_review_scheduler.services.github.uvloop", None):
+                loop = github.run_coroutine(current_loop())
+
+            assert isinstance(loop, asyncio.BaseEventLoop)
+        finally:
+            github.close_github_client()
+
+    def test_client_has_github_base_url_and_headers(self):
+        """Test that the shared client carries the API base URL and default headers."""
+
+        async def current_client():
+            return github._get_client()
+
+        try:
+            client = github.run_coroutine(current_client())
+
+            assert str(client.base_url).rstrip("/") == github.GITHUB_API_BASE
+            for name, value in github.GITHUB_HEADERS.items():
+                assert client.headers[name] == value
+        finally:
+            github.close_github_client()
+
+    def test_bearer_auth_sets_authorization_header(self):
+        """Test that the token is sent as a bearer credential."""
+        request = httpx.Request("GET", github.GITHUB_API_BASE)
+
+        flow = github._BearerAuth("ghp_test_token").auth_flow(request)
+
+        assert next(flow).headers["Authorization"] == "Bearer ghp_test_token"
+
+    def test_close_github_client_stops_loop(self):
+        """Test that closing releases the client and a later run starts fresh."""
+
+        async def current_client():
+            return github._get_client()
+
+        client = github.run_coroutine(current_client())
+        github.close_github_client()
+
+        assert client.is_closed
+        assert github._loop is None
+        assert github._client is None
+
+        # Closing again is a no-op
+        github.close_github_client()
+
+
 class TestGetRepositoryPullRequests:
     """Tests for get_repository_pull_requests function."""
 
@@ -49,10 +179,7 @@ class TestGetRepositoryPullRequests:
             },
         ]
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_pr_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _json_response(mock_pr_response)
 
         with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -72,31 +199,249 @@ class TestGetRepositoryPullRequests:
         assert len(result) == 2
 
         # Verify first PR
-        assert result[0]["number"] == 123
-        assert result[0]["title"] == "Add new feature"
-        assert result[0]["author"] == "testuser"
-        assert result[0]["author_avatar_url"] == "https://github.com/testuser.png"
-        assert result[0]["labels"] == '["enhancement", "ready-for-review"]'
-        assert result[0]["checks_status"] == "pass"
-        assert result[0]["html_url"] == "https://github.com/myorg/myrepo/pull/123"
-        assert result[0]["created_at"] == "2024-01-15T10:00:00Z"
-        assert result[0]["organization"] == "myorg"
-        assert result[0]["repository"] == "myrepo"
+        assert result[0].number == 123
+        assert result[0].title == "Add new feature"
+        assert result[0].author == "testuser"
+        assert result[0].author_avatar_url == "https://github.com/testuser.png"
+        assert result[0].labels == ("enhancement", "ready-for-review")
+        assert result[0].checks_status == "pass"
+        assert result[0].html_url == "https://github.com/myorg/myrepo/pull/123"
+        assert result[0].created_at == datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+        assert result[0].organization == "myorg"
+        assert result[0].repository == "myrepo"
 
         # Verify second PR
-        assert result[1]["number"] == 124
-        assert result[1]["title"] == "Fix bug"
-        assert result[1]["author"] == "otheruser"
-        assert result[1]["labels"] == "[]"
-        assert result[1]["checks_status"] == "pending"
+        assert result[1].number == 124
+        assert result[1].title == "Fix bug"
+        assert result[1].author == "otheruser"
+        assert result[1].labels == ()
+        assert result[1].checks_status == "pending"
+
+    @pytest.mark.asyncio
+    async def test_get_repository_pull_requests_uses_etag(self):
+        """Test that an unchanged PR list is served from cache on 304 Not Modified."""
+        mock_pr_response = [
+            {
+                "number": 123,
+                "title": "Add new feature",
+                "user": {"login": "testuser", "avatar_url": "https://github.com/testuser.png"},
+                "labels": [],
+                "html_url": "https://github.com/myorg/myrepo/pull/123",
+                "created_at": "2024-01-15T10:00:00Z",
+                "head": {"sha": "abc123def456"},
+            },
+        ]
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = [
+                _json_response(mock_pr_response, headers={"ETag": '"etag-1"'}),
+                httpx.Response(304, request=httpx.Request("GET", github.GITHUB_API_BASE)),
+            ]
+
+            with patch.object(
+                github, "get_pull_request_checks", new_callable=AsyncMock
+            ) as mock_checks:
+                mock_checks.return_value = "pass"
+
+                first = await github.get_repository_pull_requests(
+                    "ghp_test_token", "myorg", "myrepo"
+                )
+                second = await github.get_repository_pull_requests(
+                    "ghp_test_token", "myorg", "myrepo"
+                )
+
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"etag-1"'
+        assert second == first
+        assert second[0].number == 123
+
+    @pytest.mark.asyncio
+    async def test_get_repository_pull_requests_caches_parsed_prs(self):
+        """Test that parsed PRs are cached and a 304 gives them fresh checks statuses."""
+        mock_pr_response = [
+            {
+                "number": 123,
+                "title": "Add new feature",
+                "user": {"login": "testuser", "avatar_url": "https://github.com/testuser.png"},
+                "labels": [{"name": "bug"}],
+                "html_url": "https://github.com/myorg/myrepo/pull/123",
+                "created_at": "2024-01-15T10:00:00Z",
+                "head": {"sha": "abc123def456", "repo": {"full_name": "myorg/myrepo"}},
+                "_links": {"self": {"href": "https://api.github.com/repos/myorg/myrepo/pulls/123"}},
+            },
+        ]
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = [
+                _json_response(mock_pr_response, headers={"ETag": '"etag-1"'}),
+                httpx.Response(304, request=httpx.Request("GET", github.GITHUB_API_BASE)),
+            ]
+
+            with patch.object(
+                github, "get_pull_request_checks", new_callable=AsyncMock
+            ) as mock_checks:
+                mock_checks.side_effect = ["pending", "pass"]
+
+                first = await github.get_repository_pull_requests(
+                    "ghp_test_token", "myorg", "myrepo"
+                )
+                second = await github.get_repository_pull_requests(
+                    "ghp_test_token", "myorg", "myrepo"
+                )
+
+        etag, pulls = github._pulls_cache[(github._token_key("ghp_test_token"), "myorg", "myrepo")]
+        assert etag == '"etag-1"'
+        assert pulls == (("abc123def456", replace(first[0], checks_status=None)),)
+        assert first[0].labels == ("bug",)
+        assert first[0].checks_status == "pending"
+        assert second == [replace(first[0], checks_status="pass")]
+
+    @pytest.mark.asyncio
+    async def test_get_repository_pull_requests_etag_is_per_token(self):
+        """Test that a cached ETag is not sent with a different access token."""
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _json_response([], headers={"ETag": '"etag-1"'})
+
+            await github.get_repository_pull_requests("ghp_token_a", "myorg", "myrepo")
+            await github.get_repository_pull_requests("ghp_token_b", "myorg", "myrepo")
+
+        assert "If-None-Match" not in mock_get.call_args_list[1].kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_get_repository_pull_requests_follows_pagination(self):
+        """Test that every page of open PRs is fetched and paged lists aren't cached."""
+        next_url = f"{github.GITHUB_API_BASE}/repos/myorg/myrepo/pulls?page=2"
+        first_page = [{"number": 1, "head": {"sha": "sha1"}, "created_at": "2024-01-15T10:00:00Z"}]
+        second_page = [{"number": 2, "head": {"sha": "sha2"}, "created_at": "2024-01-15T10:00:00Z"}]
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = [
+                _json_response(
+                    first_page,
+                    headers={"ETag": '"etag-1"', "Link": f'<{next_url}>; rel="next"'},
+                ),
+                _json_response(second_page),
+            ]
+
+            with patch.object(
+                github, "get_pull_request_checks", new_callable=AsyncMock
+            ) as mock_checks:
+                mock_checks.return_value = "pass"
+
+                result = await github.get_repository_pull_requests(
+                    "ghp_test_token", "myorg", "myrepo"
+                )
+
+        assert [pr.number for pr in result] == [1, 2]
+        assert mock_get.call_args_list[1].args[0] == next_url
+        assert github._pulls_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_get_repository_pull_requests_fetches_checks_concurrently(self):
+        """Test that check runs for all PRs are requested at the same time."""
+        prs = [
+            {"number": n, "head": {"sha": f"sha{n}"}, "created_at": "2024-01-15T10:00:00Z"}
+            for n in range(1, 4)
+        ]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_checks(access_token, organization, repository, sha):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if sha == "sha2":
+                raise RuntimeError("boom")
+            return "pass"
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _json_response(prs)
+
+            with patch.object(github, "get_pull_request_checks", side_effect=fake_checks):
+                result = await github.get_repository_pull_requests(
+                    "ghp_test_token", "myorg", "myrepo"
+                )
+
+        assert max_in_flight == 3
+        assert [pr.checks_status for pr in result] == ["pass", "pending", "pass"]
+
+    @pytest.mark.asyncio
+    async def test_get_repository_pull_requests_bounds_concurrent_requests(self):
+        """Test that check-run requests wait for a free request slot."""
+        prs = [
+            {"number": n, "head": {"sha": f"sha{n}"}, "created_at": "2024-01-15T10:00:00Z"}
+            for n in range(1, 6)
+        ]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_get(url, **kwargs):
+            nonlocal in_flight, max_in_flight
+            if url.endswith("/pulls"):
+                return _json_response(prs)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _json_response({"check_runs": []})
+
+        with (
+            patch.object(github, "_MAX_CONCURRENT_REQUESTS", 2),
+            patch.object(httpx.AsyncClient, "get", side_effect=fake_get),
+        ):
+            result = await github.get_repository_pull_requests("ghp_test_token", "myorg", "myrepo")
+
+        assert max_in_flight == 2
+        assert [pr.checks_status for pr in result] == ["pass"] * 5
+
+    @pytest.mark.asyncio
+    async def test_get_repository_pull_requests_fetches_checks_once_per_sha(self):
+        """Test that PRs sharing a head commit share one check-runs request."""
+        prs = [
+            {"number": 1, "head": {"sha": "shared"}, "created_at": "2024-01-15T10:00:00Z"},
+            {"number": 2, "head": {"sha": "shared"}, "created_at": "2024-01-15T10:00:00Z"},
+            {"number": 3, "head": {"sha": "other"}, "created_at": "2024-01-15T10:00:00Z"},
+        ]
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _json_response(prs)
+
+            with patch.object(
+                github, "get_pull_request_checks", new_callable=AsyncMock
+            ) as mock_checks:
+                mock_checks.side_effect = lambda token, org, repo, sha: (
+                    "fail" if sha == "shared" else "pass"
+                )
+                result = await github.get_repository_pull_requests(
+                    "ghp_test_token", "myorg", "myrepo"
+                )
+
+        assert mock_checks.call_count == 2
+        assert [pr.checks_status for pr in result] == ["fail", "fail", "pass"]
+
+    @pytest.mark.asyncio
+    async def test_get_repository_pull_requests_coalesces_concurrent_calls(self):
+        """Test that concurrent fetches of one repo with one token share a request."""
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _json_response([])
+
+            results = await asyncio.gather(
+                github.get_repository_pull_requests("ghp_test_token", "myorg", "myrepo"),
+                github.get_repository_pull_requests("ghp_test_token", "myorg", "myrepo"),
+                github.get_repository_pull_requests("ghp_other_token", "myorg", "myrepo"),
+            )
+
+        assert results == [[], [], []]
+        # One request per token
+        assert mock_get.call_count == 2
+        assert github._pulls_inflight == {}
 
     @pytest.mark.asyncio
     async def test_get_repository_pull_requests_empty(self):
         """Test fetch returns empty list when no PRs exist."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _json_response([])
 
         with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -157,10 +502,7 @@ class TestGetPullRequestChecks:
             ],
         }
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_check_runs_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _json_response(mock_check_runs_response)
 
         with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -186,10 +528,7 @@ class TestGetPullRequestChecks:
             ],
         }
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_check_runs_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _json_response(mock_check_runs_response)
 
         with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -215,10 +554,7 @@ class TestGetPullRequestChecks:
             ],
         }
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_check_runs_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _json_response(mock_check_runs_response)
 
         with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -240,10 +576,7 @@ class TestGetPullRequestChecks:
             "check_runs": [],
         }
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_check_runs_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _json_response(mock_check_runs_response)
 
         with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -288,10 +621,7 @@ class TestGetPullRequestChecks:
             ],
         }
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_check_runs_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _json_response(mock_check_runs_response)
 
         with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
             mock_get.return_value = mock_response
@@ -304,3 +634,242 @@ class TestGetPullRequestChecks:
             )
 
         assert result == "fail"
+
+    @pytest.mark.asyncio
+    async def test_get_pull_request_checks_uses_etag(self):
+        """Test that unchanged check runs are served from cache on 304 Not Modified."""
+        check_runs = {"check_runs": [{"status": "completed", "conclusion": "failure"}]}
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = [
+                _json_response(check_runs, headers={"ETag": '"checks-1"'}),
+                httpx.Response(304, request=httpx.Request("GET", github.GITHUB_API_BASE)),
+            ]
+
+            first = await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", "abc")
+            second = await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", "abc")
+
+        assert first == second == "fail"
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"checks-1"'
+
+    @pytest.mark.asyncio
+    async def test_get_pull_request_checks_passed_commit_not_refetched(self):
+        """Test that a commit whose checks all passed isn't requested again."""
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _json_response(
+                {
+                    "total_count": 1,
+                    "check_runs": [{"status": "completed", "conclusion": "success"}],
+                }
+            )
+
+            first = await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", "abc")
+            second = await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", "abc")
+
+        assert first == second == "pass"
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["params"] == {"per_page": 100}
+
+    @pytest.mark.asyncio
+    async def test_get_pull_request_checks_passed_commit_refetched_after_ttl(self):
+        """Test that a passed commit is requested again once its memoized status expires."""
+        response = _json_response(
+            {"total_count": 1, "check_runs": [{"status": "completed", "conclusion": "success"}]}
+        )
+        with (
+            patch.object(
+                httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=response
+            ) as mock_get,
+            patch("pr_review_scheduler.services.github.time.monotonic") as mock_monotonic,
+        ):
+            mock_monotonic.return_value = 1000.0
+            await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", "abc")
+
+            mock_monotonic.return_value = 1000.0 + github._SETTLED_CHECKS_TTL + 1
+            await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", "abc")
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_pull_request_checks_partial_page_not_memoized(self):
+        """Test that a pass based on only some of a commit's check runs is not memoized."""
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _json_response(
+                {
+                    "total_count": 101,
+                    "check_runs": [{"status": "completed", "conclusion": "success"}] * 100,
+                }
+            )
+
+            await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", "abc")
+            await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", "abc")
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_pull_request_checks_failed_commit_refetched(self):
+        """Test that failed or missing checks are requested again, as they may change."""
+        responses = [
+            _json_response({"check_runs": [{"status": "completed", "conclusion": "failure"}]}),
+            _json_response({"check_runs": []}),
+        ]
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = responses + responses
+
+            for sha in ("failed", "empty", "failed", "empty"):
+                await github.get_pull_request_checks("ghp_token", "myorg", "myrepo", sha)
+
+        assert mock_get.call_count == 4
+
+
+class TestRateLimiting:
+    """Tests for pacing requests against GitHub's rate limit."""
+
+    @pytest.mark.asyncio
+    async def test_exhausted_rate_limit_raises(self):
+        """Test that a 403 with no remaining budget raises RateLimitError."""
+        reset_at = time.time() + 600
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _json_response(
+                {"message": "API rate limit exceeded"},
+                status_code=403,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)},
+            )
+
+            with pytest.raises(github.RateLimitError) as exc_info:
+                await github.get_repository_pull_requests("ghp_test_token", "myorg", "myrepo")
+
+            # Later requests with the same token fail fast without calling GitHub
+            with pytest.raises(github.RateLimitError):
+                await github.get_pull_request_checks("ghp_test_token", "myorg", "myrepo", "abc")
+
+        assert exc_info.value.reset_at == reset_at
+        assert mock_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_low_rate_limit_spreads_requests(self):
+        """Test that requests are spread over the window once the budget runs low."""
+        limiter = github._get_rate_limiter(github._token_key("ghp_test_token"))
+        limiter.update(
+            _json_response(
+                {},
+                headers={"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1000"},
+            )
+        )
+
+        with (
+            patch("pr_review_scheduler.services.github.time.time", return_value=900.0),
+            patch(
+                "pr_review_scheduler.services.github.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            await limiter.acquire()
+
+        mock_sleep.assert_awaited_once_with(10.0)
+        assert limiter.remaining == 9
+
+    @pytest.mark.asyncio
+    async def test_low_rate_limit_waits_without_holding_lock(self):
+        """Test that paced requests reserve successive slots and wait concurrently."""
+        limiter = github._get_rate_limiter(github._token_key("ghp_test_token"))
+        limiter.update(
+            _json_response(
+                {},
+                headers={"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "1000"},
+            )
+        )
+        delays = []
+        both_waiting = asyncio.Event()
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            if len(delays) == 2:
+                both_waiting.set()
+            await both_waiting.wait()
+
+        with (
+            patch("pr_review_scheduler.services.github.time.time", return_value=900.0),
+            patch("pr_review_scheduler.services.github.asyncio.sleep", side_effect=fake_sleep),
+        ):
+            # Deadlocks (and times out) if the first waiter holds the lock while sleeping
+            await asyncio.wait_for(asyncio.gather(limiter.acquire(), limiter.acquire()), 1.0)
+
+        assert delays == pytest.approx([2.0, 2.0 + 100 / 49])
+        assert limiter.remaining == 48
+
+    @pytest.mark.asyncio
+    async def test_low_rate_limit_fails_fast_when_slot_is_too_far(self):
+        """Test that a fetch under a timeout fails fast rather than waiting out a far slot."""
+        limiter = github._get_rate_limiter(github._token_key("ghp_test_token"))
+        limiter.remaining = 5
+        limiter.reset_at = time.time() + 3600
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            with pytest.raises(github.RateLimitError):
+                await asyncio.wait_for(
+                    github.get_repository_pull_requests("ghp_test_token", "myorg", "myrepo"),
+                    timeout=1.0,
+                )
+
+        mock_get.assert_not_called()
+        # No slot was reserved for the abandoned request
+        assert limiter.remaining == 5
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_window_reset_resumes_requests(self):
+        """Test that requests go out unpaced again once the limit window has reset."""
+        limiter = github._get_rate_limiter(github._token_key("ghp_test_token"))
+        limiter.remaining = 0
+        limiter.reset_at = 1000.0
+
+        with (
+            patch("pr_review_scheduler.services.github.time.time", return_value=1001.0),
+            patch(
+                "pr_review_scheduler.services.github.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            await limiter.acquire()
+            await limiter.acquire()
+
+        mock_sleep.assert_not_awaited()
+        assert limiter.remaining is None
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_from_checks_is_raised(self):
+        """Test that a RateLimitError while fetching checks fails the whole repository."""
+        mock_response = _json_response(
+            [{"number": 1, "created_at": "2024-01-15T10:00:00Z", "head": {"sha": "abc123"}}]
+        )
+
+        with (
+            patch.object(
+                httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=mock_response
+            ),
+            patch.object(
+                github,
+                "get_pull_request_checks",
+                new_callable=AsyncMock,
+                side_effect=github.RateLimitError(1000.0),
+            ),
+            pytest.raises(github.RateLimitError) as exc_info,
+        ):
+            await github.get_repository_pull_requests("ghp_test_token", "myorg", "myrepo")
+
+        assert exc_info.value.reset_at == 1000.0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_per_token(self):
+        """Test that one token's exhausted budget doesn't block another token."""
+        limiter = github._get_rate_limiter(github._token_key("ghp_test_token"))
+        limiter.remaining = 0
+        limiter.reset_at = time.time() + 600
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = _json_response({"check_runs": []})
+
+            result = await github.get_pull_request_checks(
+                "ghp_other_token", "myorg", "myrepo", "abc"
+            )
+
+        assert result == "pass"
@@ -1,18 +1,47 @@
 """Tests for schedule synchronization."""
 
+import itertools
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from pr_review_scheduler import sync
 from pr_review_scheduler.sync import sync_schedules
 
 
+def _schedule(schedule_id: str, cron_expression: str, is_active: bool = True) -> dict:
+    """Build a schedule status row as returned by get_schedules_with_status."""
+    return {"id": schedule_id, "cron_expression": cron_expression, "is_active": is_active}
+
+
+@pytest.fixture(autouse=True)
+def clear_sync_state():
+    """Forget the state recorded by previous syncs."""
+    sync.reset_sync_state()
+    yield
+    sync.reset_sync_state()
+
+
+@pytest.fixture(autouse=True)
+def mock_schedules_version():
+    """Report a new schedules version on every sync unless a test says otherwise."""
+    with patch(
+        "pr_review_scheduler.sync.get_schedules_version", side_effect=itertools.count()
+    ) as mock_version:
+        yield mock_version
+
+
 @pytest.fixture
 def mock_scheduler():
     """Create a mock scheduler with common methods."""
-    scheduler = MagicMock()
-    scheduler.get_jobs.return_value = []
-    return scheduler
+    return MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def mock_job_ids():
+    """Report the IDs of currently scheduled jobs; none unless a test says otherwise."""
+    with patch("pr_review_scheduler.sync.get_job_ids", return_value=frozenset()) as mock_ids:
+        yield mock_ids
 
 
 class TestSyncSchedules:
@@ -20,27 +49,17 @@ class TestSyncSchedules:
 
     @patch("pr_review_scheduler.sync.remove_job")
     @patch("pr_review_scheduler.sync.add_notification_job")
-    @patch("pr_review_scheduler.sync.get_all_schedule_ids")
-    @patch("pr_review_scheduler.sync.get_active_schedules")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
     def test_sync_schedules_adds_new_jobs(
         self,
-        mock_get_active,
-        mock_get_all_ids,
+        mock_get_statuses,
         mock_add_job,
         mock_remove_job,
         mock_scheduler,
     ):
         """Test that new schedules are added as jobs."""
         # Setup: One active schedule, no existing jobs
-        mock_get_active.return_value = [
-            {
-                "id": "schedule-1",
-                "cron_expression": "0 9 * * 1-5",
-                "name": "Test Schedule",
-            }
-        ]
-        mock_get_all_ids.return_value = ["schedule-1"]
-        mock_scheduler.get_jobs.return_value = []
+        mock_get_statuses.return_value = [_schedule("schedule-1", "0 9 * * 1-5")]
 
         # Execute
         sync_schedules(mock_scheduler)
@@ -51,24 +70,20 @@ class TestSyncSchedules:
 
     @patch("pr_review_scheduler.sync.remove_job")
     @patch("pr_review_scheduler.sync.add_notification_job")
-    @patch("pr_review_scheduler.sync.get_all_schedule_ids")
-    @patch("pr_review_scheduler.sync.get_active_schedules")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
     def test_sync_schedules_removes_deleted_jobs(
         self,
-        mock_get_active,
-        mock_get_all_ids,
+        mock_get_statuses,
         mock_add_job,
         mock_remove_job,
         mock_scheduler,
+        mock_job_ids,
     ):
         """Test that deleted schedules have their jobs removed."""
         # Setup: No active schedules, but a job exists for a deleted schedule
-        mock_get_active.return_value = []
-        mock_get_all_ids.return_value = []  # Schedule was deleted from DB
+        mock_get_statuses.return_value = []  # Schedule was deleted from DB
 
-        existing_job = MagicMock()
-        existing_job.id = "deleted-schedule"
-        mock_scheduler.get_jobs.return_value = [existing_job]
+        mock_job_ids.return_value = frozenset({"deleted-schedule"})
 
         # Execute
         sync_schedules(mock_scheduler)
@@ -79,24 +94,22 @@ class TestSyncSchedules:
 
     @patch("pr_review_scheduler.sync.remove_job")
     @patch("pr_review_scheduler.sync.add_notification_job")
-    @patch("pr_review_scheduler.sync.get_all_schedule_ids")
-    @patch("pr_review_scheduler.sync.get_active_schedules")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
     def test_sync_schedules_removes_inactive_jobs(
         self,
-        mock_get_active,
-        mock_get_all_ids,
+        mock_get_statuses,
         mock_add_job,
         mock_remove_job,
         mock_scheduler,
+        mock_job_ids,
     ):
         """Test that inactive schedules have their jobs removed."""
         # Setup: Schedule exists but is inactive
-        mock_get_active.return_value = []  # No active schedules
-        mock_get_all_ids.return_value = ["inactive-schedule"]  # But schedule exists
+        mock_get_statuses.return_value = [
+            _schedule("inactive-schedule", "0 9 * * *", is_active=False)
+        ]
 
-        existing_job = MagicMock()
-        existing_job.id = "inactive-schedule"
-        mock_scheduler.get_jobs.return_value = [existing_job]
+        mock_job_ids.return_value = frozenset({"inactive-schedule"})
 
         # Execute
         sync_schedules(mock_scheduler)
@@ -107,30 +120,22 @@ class TestSyncSchedules:
 
     @patch("pr_review_scheduler.sync.remove_job")
     @patch("pr_review_scheduler.sync.add_notification_job")
-    @patch("pr_review_scheduler.sync.get_all_schedule_ids")
-    @patch("pr_review_scheduler.sync.get_active_schedules")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
     def test_sync_schedules_updates_existing_jobs(
         self,
-        mock_get_active,
-        mock_get_all_ids,
+        mock_get_statuses,
         mock_add_job,
         mock_remove_job,
         mock_scheduler,
+        mock_job_ids,
     ):
         """Test that existing jobs are updated if cron changed."""
         # Setup: Active schedule with a job that already exists
-        mock_get_active.return_value = [
-            {
-                "id": "schedule-1",
-                "cron_expression": "0 10 * * 1-5",  # Changed from 9 to 10
-                "name": "Test Schedule",
-            }
+        mock_get_statuses.return_value = [
+            _schedule("schedule-1", "0 10 * * 1-5")  # Changed from 9 to 10
         ]
-        mock_get_all_ids.return_value = ["schedule-1"]
 
-        existing_job = MagicMock()
-        existing_job.id = "schedule-1"
-        mock_scheduler.get_jobs.return_value = [existing_job]
+        mock_job_ids.return_value = frozenset({"schedule-1"})
 
         # Execute
         sync_schedules(mock_scheduler)
@@ -142,32 +147,25 @@ class TestSyncSchedules:
 
     @patch("pr_review_scheduler.sync.remove_job")
     @patch("pr_review_scheduler.sync.add_notification_job")
-    @patch("pr_review_scheduler.sync.get_all_schedule_ids")
-    @patch("pr_review_scheduler.sync.get_active_schedules")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
     def test_sync_schedules_handles_multiple_schedules(
         self,
-        mock_get_active,
-        mock_get_all_ids,
+        mock_get_statuses,
         mock_add_job,
         mock_remove_job,
         mock_scheduler,
+        mock_job_ids,
     ):
         """Test syncing multiple schedules at once."""
         # Setup: Two active schedules, one deleted, one inactive
-        mock_get_active.return_value = [
-            {"id": "schedule-1", "cron_expression": "0 9 * * *", "name": "Active 1"},
-            {"id": "schedule-2", "cron_expression": "0 10 * * *", "name": "Active 2"},
+        mock_get_statuses.return_value = [
+            _schedule("schedule-1", "0 9 * * *"),
+            _schedule("schedule-2", "0 10 * * *"),
+            _schedule("schedule-3", "0 11 * * *", is_active=False),
         ]
-        mock_get_all_ids.return_value = ["schedule-1", "schedule-2", "schedule-3"]
 
         # Existing jobs: schedule-1 (active), schedule-3 (inactive), schedule-4 (deleted)
-        job1 = MagicMock()
-        job1.id = "schedule-1"
-        job3 = MagicMock()
-        job3.id = "schedule-3"
-        job4 = MagicMock()
-        job4.id = "schedule-4"
-        mock_scheduler.get_jobs.return_value = [job1, job3, job4]
+        mock_job_ids.return_value = frozenset({"schedule-1", "schedule-3", "schedule-4"})
 
         # Execute
         sync_schedules(mock_scheduler)
@@ -183,26 +181,20 @@ class TestSyncSchedules:
 
     @patch("pr_review_scheduler.sync.remove_job")
     @patch("pr_review_scheduler.sync.add_notification_job")
-    @patch("pr_review_scheduler.sync.get_all_schedule_ids")
-    @patch("pr_review_scheduler.sync.get_active_schedules")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
     def test_sync_schedules_no_changes_needed(
         self,
-        mock_get_active,
-        mock_get_all_ids,
+        mock_get_statuses,
         mock_add_job,
         mock_remove_job,
         mock_scheduler,
+        mock_job_ids,
     ):
         """Test sync when schedules haven't changed still re-syncs jobs."""
         # Setup: One active schedule that already has a job
-        mock_get_active.return_value = [
-            {"id": "schedule-1", "cron_expression": "0 9 * * *", "name": "Test"}
-        ]
-        mock_get_all_ids.return_value = ["schedule-1"]
+        mock_get_statuses.return_value = [_schedule("schedule-1", "0 9 * * *")]
 
-        existing_job = MagicMock()
-        existing_job.id = "schedule-1"
-        mock_scheduler.get_jobs.return_value = [existing_job]
+        mock_job_ids.return_value = frozenset({"schedule-1"})
 
         # Execute
         sync_schedules(mock_scheduler)
@@ -210,3 +202,127 @@ class TestSyncSchedules:
         # Verify: Job is still re-added (idempotent behavior)
         mock_add_job.assert_called_once()
         mock_remove_job.assert_not_called()
+
+    @patch("pr_review_scheduler.sync.remove_job")
+    @patch("pr_review_scheduler.sync.add_notification_job")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
+    def test_sync_schedules_skips_unchanged_jobs(
+        self,
+        mock_get_statuses,
+        mock_add_job,
+        mock_remove_job,
+        mock_scheduler,
+        mock_job_ids,
+    ):
+        """Test that a job already synced with the same cron is left alone."""
+        mock_get_statuses.return_value = [_schedule("schedule-1", "0 9 * * *")]
+
+        # First sync adds the job
+        assert sync_schedules(mock_scheduler) == 1
+
+        mock_job_ids.return_value = frozenset({"schedule-1"})
+
+        # Second sync sees no changes
+        assert sync_schedules(mock_scheduler) == 0
+
+        mock_add_job.assert_called_once()
+        mock_remove_job.assert_not_called()
+
+    @patch("pr_review_scheduler.sync.remove_job")
+    @patch("pr_review_scheduler.sync.add_notification_job")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
+    def test_sync_schedules_replaces_job_when_cron_changes(
+        self,
+        mock_get_statuses,
+        mock_add_job,
+        mock_remove_job,
+        mock_scheduler,
+        mock_job_ids,
+    ):
+        """Test that a synced job is replaced when its cron expression changes."""
+        mock_get_statuses.return_value = [_schedule("schedule-1", "0 9 * * *")]
+        sync_schedules(mock_scheduler)
+
+        mock_job_ids.return_value = frozenset({"schedule-1"})
+        mock_get_statuses.return_value = [_schedule("schedule-1", "0 10 * * *")]
+
+        assert sync_schedules(mock_scheduler) == 1
+
+        assert mock_add_job.call_count == 2
+        mock_add_job.assert_called_with(mock_scheduler, "schedule-1", "0 10 * * *")
+        mock_remove_job.assert_not_called()
+
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
+    def test_sync_schedules_skips_when_version_unchanged(
+        self,
+        mock_get_statuses,
+        mock_schedules_version,
+        mock_scheduler,
+        mock_job_ids,
+    ):
+        """Test that an unchanged schedules version skips the reconcile entirely."""
+        mock_schedules_version.side_effect = None
+        mock_schedules_version.return_value = (1, None, 1)
+        mock_get_statuses.return_value = []
+
+        sync_schedules(mock_scheduler)
+        assert sync_schedules(mock_scheduler) == 0
+
+        mock_get_statuses.assert_called_once()
+
+    @patch("pr_review_scheduler.sync.remove_job")
+    @patch("pr_review_scheduler.sync.add_notification_job")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
+    def test_sync_schedules_repopulates_fresh_scheduler(
+        self,
+        mock_get_statuses,
+        mock_add_job,
+        mock_remove_job,
+        mock_schedules_version,
+        mock_scheduler,
+        mock_job_ids,
+    ):
+        """Test that a fresh scheduler gets its jobs even if the schedules version is unchanged."""
+        mock_schedules_version.side_effect = None
+        mock_schedules_version.return_value = (1, None, 1)
+        mock_get_statuses.return_value = [_schedule("schedule-1", "0 9 * * *")]
+        mock_job_ids.side_effect = [frozenset(), frozenset({"schedule-1"})]
+
+        assert sync_schedules(mock_scheduler) == 1
+
+        # A new scheduler starts with no jobs
+        mock_job_ids.side_effect = None
+        mock_job_ids.return_value = frozenset()
+        new_scheduler = MagicMock()
+
+        assert sync_schedules(new_scheduler) == 1
+
+        mock_add_job.assert_called_with(new_scheduler, "schedule-1", "0 9 * * *")
+        assert mock_add_job.call_count == 2
+        mock_remove_job.assert_not_called()
+
+    @patch("pr_review_scheduler.sync.add_notification_job")
+    @patch("pr_review_scheduler.sync.get_schedules_with_status")
+    def test_reset_sync_state_forces_full_sync(
+        self,
+        mock_get_statuses,
+        mock_add_job,
+        mock_schedules_version,
+        mock_scheduler,
+        mock_job_ids,
+    ):
+        """Test that reset_sync_state makes the next sync reconcile every schedule."""
+        mock_schedules_version.side_effect = None
+        mock_schedules_version.return_value = (1, None, 1)
+        mock_get_statuses.return_value = [_schedule("schedule-1", "0 9 * * *")]
+        mock_job_ids.side_effect = [frozenset(), frozenset({"schedule-1"})]
+        sync_schedules(mock_scheduler)
+
+        mock_job_ids.side_effect = None
+        mock_job_ids.return_value = frozenset({"schedule-1"})
+        sync.reset_sync_state()
+
+        # The job's cron is no longer known, so it is replaced
+        assert sync_schedules(mock_scheduler) == 1
+        assert mock_get_statuses.call_count == 2
+        assert mock_add_job.call_count == 2
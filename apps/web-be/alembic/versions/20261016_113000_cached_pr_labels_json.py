@@ -0,0 +1,43 @@
+"""cached_pr_labels_json
+
+Revision ID: 6a1f0d4e8b37
+Revises: 3c9e5a7b1d24
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6a1f0d4e8b37"
+down_revision: Union[str, None] = "3c9e5a7b1d24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing values are already JSON text, so they convert in place.
+    # Batch mode lets SQLite rebuild the table to change the column type.
+    with op.batch_alter_table("cached_pull_requests") as batch_op:
+        batch_op.alter_column(
+            "labels",
+            existing_type=sa.String(),
+            type_=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using="labels::json",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("cached_pull_requests") as batch_op:
+        batch_op.alter_column(
+            "labels",
+            existing_type=sa.JSON(),
+            type_=sa.String(),
+            existing_nullable=True,
+            postgresql_using="labels::text",
+        )
@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from pr_review_api.database import Base
@@ -34,7 +34,7 @@ class CachedPullRequest(Base):
         title: Pull request title.
         author: PR author username.
         author_avatar_url: URL to author's GitHub avatar.
-        labels: JSON string of label data.
+        labels: List of label names.
         checks_status: Status of PR checks ('pass', 'fail', 'pending').
         html_url: URL to the pull request on GitHub.
         created_at: When the PR was created on GitHub.
@@ -56,7 +56,7 @@ class CachedPullRequest(Base):
     title = Column(String, nullable=False)
     author = Column(String, nullable=False)
     author_avatar_url = Column(String, nullable=True)
-    labels = Column(String, nullable=True)  # JSON array
+    labels = Column(JSON(none_as_null=True), nullable=True)
     checks_status = Column(String, nullable=True)  # 'pass', 'fail', 'pending'
     html_url = Column(String, nullable=False)
     created_at = Column(DateTime, nullable=False)
@@ -42,7 +42,7 @@ class NotificationSchedule(Base):
     name = Column(String, nullable=False)
     cron_expression = Column(String, nullable=False)
     github_pat = Column(String, nullable=False)  # Encrypted
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, index=True)
     created_at = Column(DateTime, default=utcnow)
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
 
@@ -458,7 +458,7 @@ class TestCachedPullRequestModel:
             title="Add new feature",
             author="octocat",
             author_avatar_url="https://avatars.githubusercontent.com/u/583231",
-            labels='[{"name": "enhancement", "color": "84b6eb"}]',
+            labels=["enhancement"],
             checks_status="pass",
             html_url="https://github.com/my-org/my-repo/pull/123",
             created_at=pr_created_at,
@@ -475,7 +475,7 @@ class TestCachedPullRequestModel:
         assert cached_pr.title == "Add new feature"
         assert cached_pr.author == "octocat"
         assert cached_pr.author_avatar_url is not None
-        assert cached_pr.labels is not None
+        assert cached_pr.labels == ["enhancement"]
         assert cached_pr.checks_status == "pass"
         assert cached_pr.html_url is not None
         assert cached_pr.cached_at is not None